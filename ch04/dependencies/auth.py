@@ -1,75 +1,153 @@
+import hashlib
 from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
 
 import jwt
 import redis.asyncio as aioredis
-from fastapi import Depends, Header, HTTPException
+from fastapi import Depends, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ch04.config.config import settings
 from ch04.dependencies.mysql import get_session
 from ch04.dependencies.valkey import get_client
-from ch04.models.user import User
+from ch04.models.user import User, UserRole
+
+# 요청마다 settings 속성 체인을 따라가지 않도록 JWT 설정을 모듈 상수로 고정합니다.
+_JWT_SECRET = settings.jwt.secret_key
+_JWT_ALG = settings.jwt.algorithm
+_JWT_EXP = timedelta(minutes=settings.jwt.expire_minutes)
+
+
+class BearerScheme(HTTPBearer):
+    """
+    Authorization: Bearer <token> 헤더를 한 번만 파싱합니다.
+    HTTPBearer를 상속해 OpenAPI 문서(/docs)의 "Authorize" 버튼은 그대로 사용하고,
+    헤더 오류 시 응답 코드는 기존 API(Header(...) + split)와 동일하게 유지합니다.
+    - 헤더 없음: 422 (Header(...)의 필수 헤더 검증 에러와 동일), optional이면 None
+    - "<scheme> <token>" 형식이 아님: format_error_status
+    - scheme이 bearer가 아님: 401
+    """
+
+    def __init__(self, *, optional: bool = False, format_error_status: int = 422):
+        super().__init__(scheme_name="HTTPBearer", auto_error=False)
+        self.optional = optional
+        self.format_error_status = format_error_status
+
+    async def __call__(self, request: Request) -> HTTPAuthorizationCredentials | None:
+        authorization = request.headers.get("Authorization")
+        if authorization is None:
+            if self.optional:
+                return None
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "missing",
+                        "loc": ("header", "authorization"),
+                        "msg": "Field required",
+                        "input": None,
+                    }
+                ]
+            )
+
+        scheme, sep, token = authorization.partition(" ")
+        if not sep:
+            raise HTTPException(
+                status_code=self.format_error_status,
+                detail="Invalid authorization header format",
+            )
+        if scheme.lower() != "bearer":
+            raise HTTPException(status_code=401, detail="Invalid authentication scheme")
+        return HTTPAuthorizationCredentials(scheme=scheme, credentials=token)
+
+
+# 인증이 필요한 API용 (헤더 오류 시 예외가 발생하므로 None을 반환하지 않습니다.)
+bearer_scheme = BearerScheme()
+# 인증이 선택적인 API용 (헤더가 없으면 None)
+optional_bearer_scheme = BearerScheme(optional=True)
+
+
+class CurrentUser(NamedTuple):
+    """
+    인증된 사용자 정보입니다.
+    권한 확인에 필요한 컬럼만 조회해 ORM 객체 생성(identity map 등록 등)을 생략합니다.
+    """
+
+    id: int
+    username: str
+    role: UserRole
+
+
+def blacklist_key(token: str) -> str:
+    """
+    JWT 블랙리스트의 Valkey key를 반환합니다.
+    토큰 원문 대신 BLAKE2b(16 bytes) digest를 사용해 key 길이와 메모리를 줄입니다.
+    """
+    digest = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    return f"jwt_blacklist:{digest}"
+
+
+def _legacy_blacklist_key(token: str) -> str:
+    """digest 적용 이전에 사용하던 토큰 원문 key"""
+    return f"jwt_blacklist:{token}"
+
+
+async def is_blacklisted(client: aioredis.Redis, token: str) -> bool:
+    """
+    토큰이 블랙리스트에 등록되었는지 확인합니다.
+    digest key 적용 전에 등록된 토큰은 원문 key로 저장되어 있으므로,
+    배포 후 JWT 만료 시간(settings.jwt.expire_minutes)이 지날 때까지는 두 key를 함께 확인합니다.
+    (EXISTS는 여러 key를 한 번에 확인하므로 round-trip은 그대로 1번입니다.)
+    """
+    return await client.exists(blacklist_key(token), _legacy_blacklist_key(token)) > 0
 
 
 def create_access_token(username: str) -> str:
-    payload = {
-        "sub": username,
-        "iat": datetime.now(timezone.utc),
-        "exp": datetime.now(timezone.utc)
-        + timedelta(minutes=settings.jwt.expire_minutes),
-    }
-    return jwt.encode(
-        payload, settings.jwt.secret_key, algorithm=settings.jwt.algorithm
-    )
+    now = datetime.now(timezone.utc)
+    payload = {"sub": username, "iat": now, "exp": now + _JWT_EXP}
+    return jwt.encode(payload, _JWT_SECRET, algorithm=_JWT_ALG)
 
 
 async def get_current_user(
-    authorization: str = Header(...),
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     session: AsyncSession = Depends(get_session),
     client: aioredis.Redis = Depends(get_client),
-) -> User:
-    try:
-        scheme, token = authorization.split(" ", 1)
-        if scheme.lower() != "bearer":
-            raise HTTPException(status_code=401, detail="Invalid authentication scheme")
-    except ValueError as e:
-        raise HTTPException(
-            status_code=422, detail="Invalid authorization header format"
-        ) from e
+) -> CurrentUser:
+    token = credentials.credentials
 
-    if await client.exists(f"jwt_blacklist:{token}"):
+    if await is_blacklisted(client, token):
         raise HTTPException(status_code=401, detail="Token has been revoked")
 
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt.secret_key,
-            algorithms=[settings.jwt.algorithm],
-        )
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=[_JWT_ALG])
         username: str = payload.get("sub")
     except jwt.ExpiredSignatureError as e:
         raise HTTPException(status_code=401, detail="Token has expired") from e
     except jwt.InvalidTokenError as e:
         raise HTTPException(status_code=401, detail="Invalid token") from e
 
-    user = await session.scalar(
-        select(User).where(User.username == username, User.is_deleted == False)
+    result = await session.execute(
+        select(User.id, User.username, User.role).where(
+            User.username == username, User.is_deleted == False
+        )
     )
-    if user is None:
+    row = result.first()
+    if row is None:
         raise HTTPException(status_code=401, detail="User not found")
-    return user
+    return CurrentUser._make(row)
 
 
 async def get_optional_user(
-    authorization: str | None = Header(default=None),
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_bearer_scheme),
     session: AsyncSession = Depends(get_session),
     client: aioredis.Redis = Depends(get_client),
-) -> User | None:
+) -> CurrentUser | None:
     """인증이 선택적인 엔드포인트에서 사용합니다.
-    Authorization 헤더가 없으면 None을 반환하고,
-    헤더가 있으면 유효성을 검증합니다 (만료/폐기된 토큰은 401 반환).
+    Bearer 토큰이 없으면 None을 반환하고,
+    토큰이 있으면 유효성을 검증합니다 (만료/폐기된 토큰은 401 반환).
     """
-    if authorization is None:
+    if credentials is None:
         return None
-    return await get_current_user(authorization, session, client)
+    return await get_current_user(credentials, session, client)
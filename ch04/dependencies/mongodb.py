@@ -9,6 +9,12 @@ logger = logging.getLogger(__name__)
 # Motor(pymongo)는 내부적으로 connection pooling을 지원합니다.
 # maxPoolSize로 최대 connection 수를 제한하고,
 # minPoolSize로 유휴 상태에서도 유지할 최소 connection 수를 설정합니다.
+# minPoolSize=0이면 connection은 필요할 때 생성되고, maxIdleTimeMS 동안
+# 사용되지 않으면 정리되어 유휴 워커가 socket을 붙잡고 있지 않습니다.
+# compressors는 wire protocol 압축으로, 서버가 지원하는 첫 번째 방식을 사용합니다.
+# - zstd: pymongo[zstd] extra가 설치하는 backports.zstd
+#         (Python 3.14 이상은 표준 라이브러리 compression.zstd 사용)
+# - zlib: 표준 라이브러리
 _client = AsyncIOMotorClient(
     "mongodb://{user}:{passwd}@{host}:{port}".format(
         user=settings.mongodb.user,
@@ -16,8 +22,11 @@ _client = AsyncIOMotorClient(
         host=settings.mongodb.host,
         port=settings.mongodb.port,
     ),
-    maxPoolSize=10,
-    minPoolSize=10,
+    maxPoolSize=50,
+    minPoolSize=0,
+    maxIdleTimeMS=30000,
+    serverSelectionTimeoutMS=2000,
+    compressors="zstd,zlib",
 )
 
 _database: AsyncIOMotorDatabase = _client[settings.mongodb.db]
@@ -55,7 +55,7 @@ def _validate_schema(sync_conn) -> list[str]:
     """
     errors = []
     inspector = sa_inspect(sync_conn)
-    existing_tables = inspector.get_table_names()
+    existing_tables = set(inspector.get_table_names())
 
     for table_name, table in Base.metadata.tables.items():
         if table_name not in existing_tables:
@@ -64,30 +64,23 @@ def _validate_schema(sync_conn) -> list[str]:
         db_columns = {col["name"]: col for col in inspector.get_columns(table_name)}
         model_columns = {col.name: col for col in table.columns}
 
-        for col_name in model_columns:
-            if col_name not in db_columns:
-                errors.append(
-                    f"[{table_name}] 컬럼 '{col_name}'이 모델에는 있지만 "
-                    f"DB에는 없습니다."
-                )
-
-        for col_name in db_columns:
-            if col_name not in model_columns:
-                errors.append(
-                    f"[{table_name}] 컬럼 '{col_name}'이 DB에는 있지만 "
-                    f"모델에는 없습니다."
-                )
+        for col_name in sorted(model_columns.keys() - db_columns.keys()):
+            errors.append(
+                f"[{table_name}] 컬럼 '{col_name}'이 모델에는 있지만 DB에는 없습니다."
+            )
 
-        for col_name in model_columns:
-            if col_name not in db_columns:
-                continue
-            model_col = model_columns[col_name]
-            db_col = db_columns[col_name]
+        for col_name in sorted(db_columns.keys() - model_columns.keys()):
+            errors.append(
+                f"[{table_name}] 컬럼 '{col_name}'이 DB에는 있지만 모델에는 없습니다."
+            )
 
-            if model_col.nullable != db_col["nullable"]:
+        for col_name in sorted(model_columns.keys() & db_columns.keys()):
+            model_nullable = model_columns[col_name].nullable
+            db_nullable = db_columns[col_name]["nullable"]
+            if model_nullable != db_nullable:
                 errors.append(
                     f"[{table_name}.{col_name}] nullable 불일치: "
-                    f"모델={model_col.nullable}, DB={db_col['nullable']}"
+                    f"모델={model_nullable}, DB={db_nullable}"
                 )
 
     return errors
@@ -1,7 +1,7 @@
 import logging
-from typing import AsyncGenerator
 
 import aioboto3
+from aiobotocore.client import AioBaseClient
 from botocore.exceptions import ClientError
 
 from ch04.config.config import settings
@@ -9,33 +9,45 @@ from ch04.config.config import settings
 logger = logging.getLogger(__name__)
 
 # aioboto3 Session은 thread-safe하며 재사용 가능합니다.
-# S3 client는 요청마다 async context manager로 생성합니다.
+# S3 client는 생성 비용(endpoint 해석, 서비스 모델 로딩 등)이 크므로
+# 서버 시작 시 한 번만 생성하고 모든 요청에서 공유합니다.
+# aiobotocore client는 여러 task에서 동시에 사용해도 안전합니다.
 _session = aioboto3.Session(
     aws_access_key_id=settings.s3.access_key,
     aws_secret_access_key=settings.s3.secret_key,
     region_name=settings.s3.region,
 )
+_client: AioBaseClient | None = None
 
 
-async def get_s3_client() -> AsyncGenerator:
+async def get_s3_client() -> AioBaseClient:
     """FastAPI Depends()에서 사용할 S3 client dependency."""
-    async with _session.client(
-        "s3",
-        endpoint_url=settings.s3.endpoint_url,
-    ) as client:
-        yield client
+    if _client is None:
+        raise RuntimeError("S3 client가 초기화되지 않았습니다.")
+    return _client
 
 
 async def startup() -> None:
-    """서버 시작 시 S3 연결 확인 및 버킷 초기화를 수행합니다."""
-    async with _session.client("s3", endpoint_url=settings.s3.endpoint_url) as s3:
-        try:
-            await s3.create_bucket(Bucket=settings.s3.bucket_name)
-            logger.info("S3 버킷 생성 완료: %s", settings.s3.bucket_name)
-        except ClientError as e:
-            if e.response["Error"]["Code"] not in (
-                "BucketAlreadyExists",
-                "BucketAlreadyOwnedByYou",
-            ):
-                raise
-        logger.info("S3 연결 완료: bucket=%s", settings.s3.bucket_name)
+    """서버 시작 시 S3 client 생성, 연결 확인 및 버킷 초기화를 수행합니다."""
+    global _client
+    _client = await _session.client(
+        "s3", endpoint_url=settings.s3.endpoint_url
+    ).__aenter__()
+    try:
+        await _client.create_bucket(Bucket=settings.s3.bucket_name)
+        logger.info("S3 버킷 생성 완료: %s", settings.s3.bucket_name)
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in (
+            "BucketAlreadyExists",
+            "BucketAlreadyOwnedByYou",
+        ):
+            raise
+    logger.info("S3 연결 완료: bucket=%s", settings.s3.bucket_name)
+
+
+async def shutdown() -> None:
+    """서버 종료 시 S3 client를 닫습니다."""
+    global _client
+    if _client:
+        await _client.__aexit__(None, None, None)
+    _client = None
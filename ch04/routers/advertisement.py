@@ -10,12 +10,12 @@ from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ch04.dependencies.auth import get_current_user, get_optional_user
+from ch04.dependencies.auth import CurrentUser, get_current_user, get_optional_user
 from ch04.dependencies.mongodb import get_database
 from ch04.dependencies.mysql import get_session
 from ch04.dependencies.valkey import get_client as get_valkey_client
 from ch04.models.advertisement import Advertisement
-from ch04.models.user import User, UserRole
+from ch04.models.user import UserRole
 
 logger = logging.getLogger(__name__)
 
@@ -163,7 +163,7 @@ async def get_click_history(
 @router.post("", response_model=AdResponse, status_code=201)
 async def write_ad(
     body: WriteAdRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
     valkey: aioredis.Redis = Depends(get_valkey_client),
 ) -> Advertisement:
@@ -209,7 +209,7 @@ async def get_ad(
     ad_id: int,
     request: Request,
     is_true_view: bool = Query(default=False),
-    current_user: User | None = Depends(get_optional_user),
+    current_user: CurrentUser | None = Depends(get_optional_user),
     session: AsyncSession = Depends(get_session),
     valkey: aioredis.Redis = Depends(get_valkey_client),
     db: AsyncIOMotorDatabase = Depends(get_database),
@@ -250,7 +250,7 @@ async def get_ad(
 async def click_ad(
     ad_id: int,
     request: Request,
-    current_user: User | None = Depends(get_optional_user),
+    current_user: CurrentUser | None = Depends(get_optional_user),
     session: AsyncSession = Depends(get_session),
     db: AsyncIOMotorDatabase = Depends(get_database),
 ) -> str:
@@ -9,14 +9,13 @@ from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ch04.dependencies.auth import get_current_user
+from ch04.dependencies.auth import CurrentUser, get_current_user
 from ch04.dependencies.mysql import get_session
 from ch04.dependencies.opensearch import get_client as get_os_client
 from ch04.dependencies.valkey import get_client as get_valkey_client
 from ch04.models.article import Article
 from ch04.models.board import Board
 from ch04.models.comment import Comment
-from ch04.models.user import User
 
 logger = logging.getLogger(__name__)
 
@@ -149,7 +148,7 @@ async def search_articles(
 async def write_article(
     board_id: int,
     body: WriteArticleRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
     os_client: AsyncOpenSearch = Depends(get_os_client),
     valkey: aioredis.Redis = Depends(get_valkey_client),
@@ -242,7 +241,7 @@ async def edit_article(
     board_id: int,
     article_id: int,
     body: EditArticleRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
     os_client: AsyncOpenSearch = Depends(get_os_client),
     valkey: aioredis.Redis = Depends(get_valkey_client),
@@ -282,7 +281,7 @@ async def edit_article(
 async def delete_article(
     board_id: int,
     article_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
     os_client: AsyncOpenSearch = Depends(get_os_client),
     valkey: aioredis.Redis = Depends(get_valkey_client),
@@ -7,12 +7,11 @@ from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ch04.dependencies.auth import get_current_user
+from ch04.dependencies.auth import CurrentUser, get_current_user
 from ch04.dependencies.mysql import get_session
 from ch04.dependencies.valkey import get_client as get_valkey_client
 from ch04.models.article import Article
 from ch04.models.comment import Comment
-from ch04.models.user import User
 
 logger = logging.getLogger(__name__)
 
@@ -85,7 +84,7 @@ async def write_comment(
     board_id: int,
     article_id: int,
     body: WriteCommentRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
     valkey: aioredis.Redis = Depends(get_valkey_client),
 ) -> Comment:
@@ -112,7 +111,7 @@ async def edit_comment(
     article_id: int,
     comment_id: int,
     body: WriteCommentRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
     valkey: aioredis.Redis = Depends(get_valkey_client),
 ) -> Comment:
@@ -145,7 +144,7 @@ async def delete_comment(
     board_id: int,
     article_id: int,
     comment_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
     valkey: aioredis.Redis = Depends(get_valkey_client),
 ) -> str:
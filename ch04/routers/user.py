@@ -3,14 +3,23 @@ from datetime import datetime, timezone
 
 import jwt
 import redis.asyncio as aioredis
-from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ch04.config.config import settings
-from ch04.dependencies.auth import create_access_token, get_current_user
+from ch04.dependencies.auth import (
+    BearerScheme,
+    CurrentUser,
+    bearer_scheme,
+    blacklist_key,
+    create_access_token,
+    get_current_user,
+    is_blacklisted,
+)
 from ch04.dependencies.mysql import get_session
 from ch04.dependencies.valkey import get_client
 from ch04.models.user import User, UserRole
@@ -19,6 +28,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+# 토큰 검증 API는 기존과 같이 헤더 형식 오류도 401로 응답합니다.
+_validation_bearer_scheme = BearerScheme(format_error_status=401)
+
 
 class SignUpRequest(BaseModel):
     username: str
@@ -53,7 +65,7 @@ class UpdateRoleRequest(BaseModel):
 
 @router.get("", response_model=list[UserResponse])
 async def get_users(
-    _current_user: User = Depends(get_current_user),
+    _current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> list[User]:
     result = await session.scalars(select(User).where(User.is_deleted == False))
@@ -82,7 +94,7 @@ async def sign_up(
 @router.delete("/{user_id}", status_code=204)
 async def delete_user(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> None:
     if current_user.id != user_id and current_user.role != UserRole.admin:
@@ -116,7 +128,7 @@ async def login(
 
 @router.post("/logout")
 async def logout(
-    _current_user: User = Depends(get_current_user),
+    _current_user: CurrentUser = Depends(get_current_user),
 ) -> str:
     """로그아웃 (클라이언트에서 토큰 폐기)"""
     return "ok"
@@ -124,12 +136,12 @@ async def logout(
 
 @router.post("/logout/all")
 async def logout_all(
-    authorization: str = Header(...),
-    current_user: User = Depends(get_current_user),
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    current_user: CurrentUser = Depends(get_current_user),
     client: aioredis.Redis = Depends(get_client),
 ) -> str:
     """전체 로그아웃 (토큰을 Valkey 블랙리스트에 등록, TTL = 토큰 만료 시간)"""
-    token = authorization.split(" ", 1)[1]
+    token = credentials.credentials
     payload = jwt.decode(
         token,
         settings.jwt.secret_key,
@@ -137,26 +149,21 @@ async def logout_all(
     )
     exp = payload["exp"]
     ttl = max(1, exp - int(datetime.now(timezone.utc).timestamp()))
-    await client.setex(f"jwt_blacklist:{token}", ttl, current_user.username)
+    await client.setex(blacklist_key(token), ttl, current_user.username)
     return "ok"
 
 
 @router.post("/token/validation")
 async def validate_token(
-    authorization: str = Header(...),
+    credentials: HTTPAuthorizationCredentials | None = Depends(
+        _validation_bearer_scheme
+    ),
     client: aioredis.Redis = Depends(get_client),
 ) -> str:
     """토큰 유효성 검증"""
-    try:
-        scheme, token = authorization.split(" ", 1)
-        if scheme.lower() != "bearer":
-            raise HTTPException(status_code=401, detail="Invalid authentication scheme")
-    except ValueError as e:
-        raise HTTPException(
-            status_code=401, detail="Invalid authorization header format"
-        ) from e
+    token = credentials.credentials
 
-    if await client.exists(f"jwt_blacklist:{token}"):
+    if await is_blacklisted(client, token):
         raise HTTPException(status_code=403, detail="Token has been revoked")
 
     try:
@@ -177,7 +184,7 @@ async def validate_token(
 async def update_user_role(
     user_id: int,
     body: UpdateRoleRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> User:
     """유저 권한 변경 (admin 전용)"""
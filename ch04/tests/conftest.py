@@ -102,10 +102,12 @@ async def init_db(tmp_path_factory, worker_id):
 
     yield
     await mongodb_mod._client.drop_database(worker_mongo_db)
-    await opensearch_shutdown()
-    await valkey_shutdown()
-    await mongodb_shutdown()
-    await mysql_shutdown()
+    await asyncio.gather(
+        opensearch_shutdown(),
+        valkey_shutdown(),
+        mongodb_shutdown(),
+        mysql_shutdown(),
+    )
 
 
 @pytest.fixture(scope="session")
@@ -138,7 +140,6 @@ async def member(init_db, worker_id) -> dict:
         user.set_password("password123")
         session.add(user)
         await session.commit()
-        await session.refresh(user)
         user_id = user.id
 
     token = create_access_token(username)
@@ -164,7 +165,6 @@ async def board_id(init_db) -> int:
         board = Board(title="테스트 게시판", description="테스트 게시판 설명")
         session.add(board)
         await session.commit()
-        await session.refresh(board)
         return board.id
 
 
@@ -186,10 +186,21 @@ async def article_id(board_id: int, member: dict) -> int:
         )
         session.add(article)
         await session.commit()
-        await session.refresh(article)
         return article.id
 
 
+@pytest.fixture(scope="session")
+async def _http_client(init_db) -> httpx.AsyncClient:
+    """ASGITransport 기반 HTTP 클라이언트를 세션당 한 번만 생성합니다."""
+    from ch04.main import app
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        yield client
+
+
 # ── 테스트 단위 픽스처 (savepoint 트랜잭션 격리 + 외부 상태 초기화) ─────────────
 
 
@@ -200,9 +211,12 @@ async def _external_cleanup():
     from ch04.dependencies.mongodb import _database as mongo_db
     from ch04.dependencies.valkey import _client as valkey_client
 
-    await valkey_client.flushdb()
-    await mongo_db["adViewHistory"].delete_many({})
-    await mongo_db["adClickHistory"].delete_many({})
+    # 서로 독립적인 저장소이므로 동시에 초기화합니다.
+    await asyncio.gather(
+        valkey_client.flushdb(),
+        mongo_db["adViewHistory"].delete_many({}),
+        mongo_db["adClickHistory"].delete_many({}),
+    )
 
 
 @pytest.fixture
@@ -237,15 +251,85 @@ async def _test_conn(init_db):
 
 
 @pytest.fixture
-async def api_client(_test_conn) -> httpx.AsyncClient:
-    """savepoint 세션을 사용하는 테스트용 HTTP 클라이언트."""
+async def api_client(_http_client: httpx.AsyncClient, _test_conn) -> httpx.AsyncClient:
+    """
+    savepoint 세션을 사용하는 테스트용 HTTP 클라이언트.
+    클라이언트는 세션 동안 재사용하고, 세션 격리는 _test_conn의 override가 담당합니다.
+    """
+    return _http_client
+
+
+class FakeOpenSearch:
+    """
+    검색 라우트 테스트용 인메모리 OpenSearch.
+    opensearch-py는 aiohttp 기반이라 httpx mock(respx)이 닿지 않으므로
+    get_client dependency를 override하는 방식으로 대체합니다.
+    index/delete/search(match + term filter)만 지원합니다.
+    """
+
+    def __init__(self):
+        self.docs: dict[str, dict] = {}
+
+    async def index(self, **kwargs) -> None:
+        self.docs[kwargs["id"]] = kwargs["body"]
+
+    async def delete(self, **kwargs) -> None:
+        self.docs.pop(kwargs["id"], None)
+
+    async def search(self, **kwargs) -> dict:
+        query = kwargs["body"]["query"]["bool"]
+        ((field, keyword),) = query["must"]["match"].items()
+        ((term_field, term_value),) = query["filter"]["term"].items()
+        hits = [
+            {"_id": doc_id, "_source": doc}
+            for doc_id, doc in self.docs.items()
+            if keyword.lower() in str(doc.get(field, "")).lower()
+            and doc.get(term_field) == term_value
+        ]
+        return {"hits": {"hits": hits}}
+
+
+@pytest.fixture
+async def fake_os_client() -> FakeOpenSearch:
+    """route handler가 실제 OpenSearch 대신 FakeOpenSearch를 사용하게 합니다."""
+    from ch04.dependencies.opensearch import get_client
     from ch04.main import app
 
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
+    client = FakeOpenSearch()
+    app.dependency_overrides[get_client] = lambda: client
+    try:
         yield client
+    finally:
+        app.dependency_overrides.pop(get_client, None)
+
+
+@pytest.fixture
+def bulk_index_articles():
+    """
+    여러 게시글 문서를 _bulk API 한 번으로 인덱싱하는 함수를 반환합니다.
+    각 문서의 "id"는 _id로 사용하고 _source에서는 제외합니다.
+    문서마다 index(refresh=True)를 호출하는 대신 refresh도 한 번만 기다립니다.
+    """
+    from opensearchpy.helpers import async_bulk
+
+    from ch04.dependencies.opensearch import _client as os_client
+    from ch04.routers.article import ARTICLE_INDEX
+
+    async def _bulk_index(docs: list[dict]) -> None:
+        await async_bulk(
+            os_client,
+            (
+                {
+                    "_index": ARTICLE_INDEX,
+                    "_id": str(doc["id"]),
+                    "_source": {k: v for k, v in doc.items() if k != "id"},
+                }
+                for doc in docs
+            ),
+            refresh="wait_for",
+        )
+
+    return _bulk_index
 
 
 @pytest.fixture
@@ -110,7 +110,6 @@ class TestGetAd:
         ad = Advertisement(title="DB 전용 광고", content="내용")
         db_session.add(ad)
         await db_session.flush()
-        await db_session.refresh(ad)
         ad_id = ad.id
 
         # 캐시 없음 확인
@@ -1,6 +1,11 @@
 import httpx
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ch04.models.article import Article
+from ch04.models.board import Board
+from ch04.models.comment import Comment
+
 
 class TestWriteArticle:
     async def test_success(
@@ -62,8 +67,6 @@ class TestGetArticles:
         self, api_client: httpx.AsyncClient, db_session: AsyncSession
     ):
         """빈 게시판 조회 시 빈 목록을 반환합니다."""
-        from ch04.models.board import Board
-
         board = Board(title="빈 게시판", description="빈 게시판 설명")
         db_session.add(board)
         await db_session.flush()
@@ -79,8 +82,6 @@ class TestGetArticles:
         member_headers: dict,
     ):
         """게시글이 있는 게시판 조회 시 목록을 반환합니다."""
-        from ch04.models.board import Board
-
         board = Board(title="새 게시판", description="새 게시판 설명")
         db_session.add(board)
         await db_session.flush()
@@ -105,24 +106,22 @@ class TestGetArticles:
         db_session: AsyncSession,
     ):
         """last_id 기준으로 이전 페이지(오래된 글)를 조회합니다."""
-        from sqlalchemy import select
-
-        from ch04.models.article import Article
-
-        for i in range(3):
-            db_session.add(
-                Article(
-                    title=f"게시글{i + 1}",
-                    content="내용",
-                    author_id=member["id"],
-                    board_id=board_id,
-                )
-            )
-        await db_session.flush()
+        await db_session.execute(
+            insert(Article),
+            [
+                {
+                    "title": f"게시글{i + 1}",
+                    "content": "내용",
+                    "author_id": member["id"],
+                    "board_id": board_id,
+                }
+                for i in range(3)
+            ],
+        )
         result = await db_session.scalars(
-            select(Article).where(Article.board_id == board_id).order_by(Article.id)
+            select(Article.id).where(Article.board_id == board_id).order_by(Article.id)
         )
-        ids = [a.id for a in result.all()]
+        ids = list(result.all())
 
         response = await api_client.get(
             f"/boards/{board_id}/articles?last_id={ids[-1]}"
@@ -139,24 +138,22 @@ class TestGetArticles:
         db_session: AsyncSession,
     ):
         """first_id 기준으로 이후 페이지(최신 글)를 조회합니다."""
-        from sqlalchemy import select
-
-        from ch04.models.article import Article
-
-        for i in range(3):
-            db_session.add(
-                Article(
-                    title=f"게시글{i + 1}",
-                    content="내용",
-                    author_id=member["id"],
-                    board_id=board_id,
-                )
-            )
-        await db_session.flush()
+        await db_session.execute(
+            insert(Article),
+            [
+                {
+                    "title": f"게시글{i + 1}",
+                    "content": "내용",
+                    "author_id": member["id"],
+                    "board_id": board_id,
+                }
+                for i in range(3)
+            ],
+        )
         result = await db_session.scalars(
-            select(Article).where(Article.board_id == board_id).order_by(Article.id)
+            select(Article.id).where(Article.board_id == board_id).order_by(Article.id)
         )
-        ids = [a.id for a in result.all()]
+        ids = list(result.all())
 
         response = await api_client.get(
             f"/boards/{board_id}/articles?first_id={ids[0]}"
@@ -173,18 +170,18 @@ class TestGetArticles:
         db_session: AsyncSession,
     ):
         """최대 10개까지만 반환합니다."""
-        from ch04.models.article import Article
-
-        for i in range(12):
-            db_session.add(
-                Article(
-                    title=f"게시글{i + 1}",
-                    content="내용",
-                    author_id=member["id"],
-                    board_id=board_id,
-                )
-            )
-        await db_session.flush()
+        await db_session.execute(
+            insert(Article),
+            [
+                {
+                    "title": f"게시글{i + 1}",
+                    "content": "내용",
+                    "author_id": member["id"],
+                    "board_id": board_id,
+                }
+                for i in range(12)
+            ],
+        )
 
         response = await api_client.get(f"/boards/{board_id}/articles")
         assert response.status_code == 200
@@ -199,8 +196,6 @@ class TestGetArticle:
         article_id: int,
         db_session: AsyncSession,
     ):
-        from ch04.models.comment import Comment
-
         db_session.add(
             Comment(content="테스트 댓글", author_id=1, article_id=article_id)
         )
@@ -234,11 +229,9 @@ class TestSearchArticles:
         board_id: int,
         member: dict,
         db_session: AsyncSession,
+        bulk_index_articles,
     ):
         """OpenSearch content 필드 키워드 검색이 동작합니다."""
-        from ch04.dependencies.opensearch import _client as os_client
-        from ch04.models.article import Article
-
         article = Article(
             title="파이썬 게시글",
             content="파이썬과 FastAPI 를 사용한 게시판",
@@ -247,19 +240,18 @@ class TestSearchArticles:
         )
         db_session.add(article)
         await db_session.flush()
-        await db_session.refresh(article)
         article_id = article.id
 
-        await os_client.index(
-            index="article",
-            id=str(article_id),
-            body={
-                "title": "파이썬 게시글",
-                "content": "파이썬과 FastAPI 를 사용한 게시판",
-                "board_id": board_id,
-                "author_id": member["id"],
-            },
-            refresh=True,
+        await bulk_index_articles(
+            [
+                {
+                    "id": article_id,
+                    "title": "파이썬 게시글",
+                    "content": "파이썬과 FastAPI 를 사용한 게시판",
+                    "board_id": board_id,
+                    "author_id": member["id"],
+                }
+            ]
         )
 
         response = await api_client.get(
@@ -269,6 +261,37 @@ class TestSearchArticles:
         results = response.json()
         assert any(a["id"] == article_id for a in results)
 
+    async def test_search_by_content_in_memory(
+        self,
+        api_client: httpx.AsyncClient,
+        board_id: int,
+        member: dict,
+        db_session: AsyncSession,
+        fake_os_client,
+    ):
+        """인메모리 OpenSearch로 검색 결과를 DB 게시글과 매핑합니다."""
+        article = Article(
+            title="파이썬 게시글",
+            content="파이썬과 FastAPI 를 사용한 게시판",
+            author_id=member["id"],
+            board_id=board_id,
+        )
+        db_session.add(article)
+        await db_session.flush()
+
+        fake_os_client.docs[str(article.id)] = {
+            "title": article.title,
+            "content": article.content,
+            "board_id": board_id,
+            "author_id": member["id"],
+        }
+
+        response = await api_client.get(
+            f"/boards/{board_id}/articles/search?keyword=fastapi"
+        )
+        assert response.status_code == 200
+        assert [a["id"] for a in response.json()] == [article.id]
+
     async def test_search_no_results(
         self,
         api_client: httpx.AsyncClient,
@@ -1,6 +1,8 @@
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ch04.models.comment import Comment
+
 
 class TestWriteComment:
     async def test_success(
@@ -92,8 +94,6 @@ class TestEditComment:
         db_session: AsyncSession,
     ):
         # Valkey rate limit 우회를 위해 DB에 직접 삽입 (API 호출 없음)
-        from ch04.models.comment import Comment
-
         comment = Comment(
             content="수정 전 댓글",
             author_id=member["id"],
@@ -195,8 +195,6 @@ class TestDeleteComment:
         db_session: AsyncSession,
     ):
         # Valkey rate limit 우회를 위해 DB에 직접 삽입 (API 호출 없음)
-        from ch04.models.comment import Comment
-
         comment = Comment(
             content="삭제할 댓글",
             author_id=member["id"],
@@ -95,6 +95,12 @@ class TestGetUsers:
         response = await api_client.get("/users")
         assert response.status_code == 422
 
+    async def test_non_bearer_scheme(self, api_client: httpx.AsyncClient):
+        headers = {"Authorization": "Basic somevalue"}
+        response = await api_client.get("/users", headers=headers)
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Invalid authentication scheme"
+
 
 class TestDeleteUser:
     async def test_delete_own_user(self, api_client: httpx.AsyncClient, member: dict):
@@ -181,6 +187,34 @@ class TestLogoutAll:
         assert response.status_code == 401
 
 
+class TestLegacyBlacklistKey:
+    """digest key 적용 전에 토큰 원문 key로 블랙리스트에 등록된 토큰도 거부합니다."""
+
+    async def test_protected_route(
+        self, api_client: httpx.AsyncClient, member_headers: dict
+    ):
+        import ch04.dependencies.valkey as valkey_mod
+
+        token = member_headers["Authorization"].split(" ", 1)[1]
+        await valkey_mod._client.setex(f"jwt_blacklist:{token}", 60, "legacy")
+
+        response = await api_client.get("/users", headers=member_headers)
+        assert response.status_code == 401
+
+    async def test_token_validation(
+        self, api_client: httpx.AsyncClient, member_headers: dict
+    ):
+        import ch04.dependencies.valkey as valkey_mod
+
+        token = member_headers["Authorization"].split(" ", 1)[1]
+        await valkey_mod._client.setex(f"jwt_blacklist:{token}", 60, "legacy")
+
+        response = await api_client.post(
+            "/users/token/validation", headers=member_headers
+        )
+        assert response.status_code == 403
+
+
 class TestTokenValidation:
     async def test_valid_token(
         self, api_client: httpx.AsyncClient, member_headers: dict
@@ -210,6 +244,17 @@ class TestTokenValidation:
         response = await api_client.post("/users/token/validation", headers=headers)
         assert response.status_code == 401
 
+    async def test_missing_header(self, api_client: httpx.AsyncClient):
+        """Authorization 헤더가 없으면 필수 헤더 검증 에러(422)를 반환합니다."""
+        response = await api_client.post("/users/token/validation")
+        assert response.status_code == 422
+
+    async def test_malformed_header(self, api_client: httpx.AsyncClient):
+        headers = {"Authorization": "Bearertoken"}
+        response = await api_client.post("/users/token/validation", headers=headers)
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Invalid authorization header format"
+
 
 class TestUpdateRole:
     async def test_admin_can_promote_to_admin(
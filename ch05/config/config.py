@@ -1,6 +1,4 @@
-from functools import lru_cache
-
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,6 +8,19 @@ class MySQLConfig(BaseModel):
     passwd: str
     port: int
     db: str
+    # 프로세스당 최대 connection 수는 pool_size + max_overflow 입니다.
+    # uvicorn --workers N 으로 실행하면 N * (pool_size + max_overflow)가
+    # MySQL max_connections(기본 151)를 넘지 않도록 조정해야 합니다.
+    pool_size: int = 20
+    max_overflow: int = 10
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    # pool이 가득 찼을 때 connection 반환을 기다리는 최대 시간(초)
+    pool_timeout: int = 30
+    # 최근 반환된 connection부터 재사용하여 유휴 connection은 pool_recycle로 정리되게 합니다.
+    pool_use_lifo: bool = True
+    # SQL 로그 출력 (MYSQL__ECHO=true). 쿼리마다 로그 포맷팅 비용이 있으므로 기본값은 False
+    echo: bool = False
 
 
 class OpenSearchConfig(BaseModel):
@@ -21,6 +32,7 @@ class ValkeyConfig(BaseModel):
     host: str
     port: int
     passwd: str
+    max_connections: int = 64
 
 
 class MongoDBConfig(BaseModel):
@@ -29,6 +41,12 @@ class MongoDBConfig(BaseModel):
     passwd: str
     port: int
     db: str
+    max_pool_size: int = 50
+
+    @computed_field
+    @property
+    def uri(self) -> str:
+        return f"mongodb://{self.user}:{self.passwd}@{self.host}:{self.port}"
 
 
 class RabbitMQConfig(BaseModel):
@@ -37,6 +55,11 @@ class RabbitMQConfig(BaseModel):
     passwd: str
     port: int
 
+    @computed_field
+    @property
+    def uri(self) -> str:
+        return f"amqp://{self.user}:{self.passwd}@{self.host}:{self.port}/"
+
 
 class ConsumerConfig(BaseModel):
     fastapi_url: str = "http://127.0.0.1:8000"
@@ -59,6 +82,16 @@ class JwtConfig(BaseModel):
     expire_minutes: int = 60
 
 
+class BcryptConfig(BaseModel):
+    # 비밀번호 해시 cost (2^rounds 반복). BCRYPT__ROUNDS로 서버 성능에 맞게 조정합니다.
+    # bcrypt가 허용하는 범위(4~31)를 벗어나면 서버 시작 시 설정 오류로 처리합니다.
+    rounds: int = Field(default=12, ge=4, le=31)
+    # True면 서버 시작 시 해시 1회가 target_ms 이상 걸리는 cost를 측정해 사용합니다.
+    # 측정 결과가 rounds보다 작으면 rounds를 사용합니다 (cost를 낮추지 않음).
+    calibrate: bool = False
+    target_ms: int = Field(default=250, gt=0)
+
+
 class AdminConfig(BaseModel):
     username: str = "admin"
     email: str = "admin@localhost"
@@ -75,17 +108,19 @@ class Settings(BaseSettings):
     s3: S3Config
     jwt: JwtConfig
     admin: AdminConfig
+    bcrypt: BcryptConfig = BcryptConfig()
 
     model_config = SettingsConfigDict(
         env_file="ch05/config/.env",
         env_file_encoding="utf-8",
         env_nested_delimiter="__",
+        frozen=True,
     )
 
 
-@lru_cache
-def get_settings():
-    return Settings()
+# import 시점에 한 번만 생성하는 모듈 단위 singleton
+settings: Settings = Settings()
 
 
-settings: Settings = get_settings()
+def get_settings() -> Settings:
+    return settings
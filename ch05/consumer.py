@@ -11,14 +11,22 @@ FastAPI 서버가 먼저 실행되어 있어야 합니다:
 """
 
 import asyncio
+import functools
 import logging
 import sys
 
 import aio_pika
 import httpx
+import orjson
 
 from ch05.config.config import settings
 
+try:
+    # libuv 기반 event loop로 AMQP/HTTP socket 처리를 가속합니다. (Windows 미지원)
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -26,60 +34,116 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# prefetch, 동시 처리 수, httpx connection pool 크기는 함께 조정해야 합니다.
+# - PREFETCH_COUNT: broker가 ACK 없이 보내주는 최대 메시지 수
+# - MAX_CONCURRENCY: 동시에 FastAPI로 전달하는 메시지 수 (FastAPI 서버 보호)
+# - HTTP_MAX_CONNECTIONS: MAX_CONCURRENCY 이상이어야 connection 대기가 생기지 않습니다.
+PREFETCH_COUNT = 64
+MAX_CONCURRENCY = 32
+HTTP_MAX_CONNECTIONS = 40
+
+_semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+# 이 크기(bytes) 이상의 메시지는 JSON으로 감싸지 않고 body를 그대로 전달합니다.
+RAW_BODY_THRESHOLD = 1024
+
+
+async def _forward(
+    http_client: httpx.AsyncClient, message: aio_pika.IncomingMessage
+) -> httpx.Response:
+    """
+    메시지를 FastAPI로 전달합니다.
+    작은 메시지는 JSON으로, RAW_BODY_THRESHOLD 이상인 메시지는 body bytes를
+    decode/재인코딩 없이 그대로 /internal/messages/raw로 보냅니다.
+    """
+    if len(message.body) < RAW_BODY_THRESHOLD:
+        # httpx의 json=은 표준 json 모듈을 사용하므로 orjson으로 직접 직렬화합니다.
+        payload = orjson.dumps(
+            {"routing_key": message.routing_key, "body": message.body.decode()}
+        )
+        return await http_client.post(
+            "/internal/messages",
+            content=payload,
+            headers={"Content-Type": "application/json"},
+        )
+
+    return await http_client.post(
+        "/internal/messages/raw",
+        content=message.body,
+        headers={
+            "Content-Type": "application/octet-stream",
+            "X-Routing-Key": message.routing_key,
+        },
+    )
+
 
-async def on_message(message: aio_pika.IncomingMessage) -> None:
+async def on_message(
+    message: aio_pika.IncomingMessage, *, http_client: httpx.AsyncClient
+) -> None:
     """
     메시지를 수신하여 FastAPI endpoint로 전달합니다.
+    http_client는 main()에서 만든 공용 client로, keep-alive connection을 재사용합니다.
 
     - 2xx: ACK (처리 성공)
     - 4xx: ACK (잘못된 메시지, 재처리 불필요)
     - 5xx 또는 네트워크 오류: NACK + requeue (재처리)
+    - 그 외 예외 (예: UTF-8이 아닌 body): REJECT (재처리 불필요)
     """
-    async with message.process(requeue=True):
-        payload = {
-            "routing_key": message.routing_key,
-            "body": message.body.decode(),
-        }
-        logger.info("메시지 수신: routing_key=%s", message.routing_key)
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.consumer.fastapi_url}/internal/messages",
-                json=payload,
-                timeout=30.0,
-            )
-
-        if response.status_code >= 500:
-            logger.error(
-                "FastAPI 서버 오류 (status=%s), 메시지를 재처리합니다.",
-                response.status_code,
-            )
-            raise RuntimeError(f"FastAPI server error: {response.status_code}")
-
-        if response.status_code >= 400:
-            logger.error(
-                "메시지 처리 실패 (status=%s): %s",
-                response.status_code,
-                payload,
-            )
-        else:
-            logger.info("메시지 처리 완료: routing_key=%s", message.routing_key)
+    # message.process() 대신 직접 ACK/NACK 하여 HTTP 요청이 끝나는 즉시
+    # prefetch slot을 반환합니다.
+    logger.info("메시지 수신: routing_key=%s", message.routing_key)
 
+    try:
+        async with _semaphore:
+            response = await _forward(http_client, message)
+    except httpx.HTTPError:
+        logger.exception("FastAPI 서버 요청 실패, 메시지를 재처리합니다.")
+        await message.nack(requeue=True)
+        return
+    except Exception:
+        # decode 실패 등 재시도해도 처리할 수 없는 메시지는 버려서 prefetch slot을 반환합니다.
+        logger.exception(
+            "메시지 처리 중 예외 발생, 메시지를 버립니다: routing_key=%s",
+            message.routing_key,
+        )
+        await message.reject(requeue=False)
+        return
 
-async def main() -> None:
-    amqp_url = "amqp://{user}:{passwd}@{host}:{port}/".format(
-        user=settings.rabbitmq.user,
-        passwd=settings.rabbitmq.passwd,
-        host=settings.rabbitmq.host,
-        port=settings.rabbitmq.port,
-    )
+    if response.status_code >= 500:
+        logger.error(
+            "FastAPI 서버 오류 (status=%s), 메시지를 재처리합니다.",
+            response.status_code,
+        )
+        await message.nack(requeue=True)
+        return
+
+    if response.status_code >= 400:
+        logger.error(
+            "메시지 처리 실패 (status=%s): routing_key=%s",
+            response.status_code,
+            message.routing_key,
+        )
+    else:
+        logger.info("메시지 처리 완료: routing_key=%s", message.routing_key)
+    await message.ack()
 
-    connection = await aio_pika.connect_robust(amqp_url)
+
+async def main() -> None:
+    connection = await aio_pika.connect_robust(settings.rabbitmq.uri)
     logger.info("RabbitMQ 연결 완료")
 
-    async with connection:
+    # 메시지마다 client를 만들지 않고 하나의 connection pool을 공유합니다.
+    http_client = httpx.AsyncClient(
+        base_url=settings.consumer.fastapi_url,
+        timeout=30.0,
+        limits=httpx.Limits(
+            max_keepalive_connections=20, max_connections=HTTP_MAX_CONNECTIONS
+        ),
+    )
+
+    async with connection, http_client:
         channel = await connection.channel()
-        await channel.set_qos(prefetch_count=10)
+        await channel.set_qos(prefetch_count=PREFETCH_COUNT)
 
         exchange = await channel.declare_exchange(
             settings.consumer.exchange_name,
@@ -93,7 +157,9 @@ async def main() -> None:
         )
         await queue.bind(exchange, routing_key=settings.consumer.routing_key)
 
-        await queue.consume(on_message)
+        await queue.consume(
+            functools.partial(on_message, http_client=http_client), no_ack=False
+        )
         logger.info(
             "Consumer 시작: exchange=%s queue=%s routing_key=%s",
             settings.consumer.exchange_name,
@@ -109,7 +175,7 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
     except KeyboardInterrupt:
         logger.info("Consumer 종료 (KeyboardInterrupt)")
         sys.exit(0)
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+
+from ch05.dependencies.mongodb import get_database
+
+logger = logging.getLogger(__name__)
+
+# 광고 조회/클릭 히스토리처럼 요청마다 발생하는 문서를 모아서
+# insert_many 한 번으로 저장합니다.
+# - 요청 처리 중에는 queue에 넣기만 하고 (MongoDB round-trip 없음)
+# - collection별 flusher task가 _FLUSH_INTERVAL 동안 모은 문서를
+#   최대 _BATCH_SIZE개씩 저장합니다.
+_QUEUE_SIZE = 10000
+_BATCH_SIZE = 500
+_FLUSH_INTERVAL = 0.05  # 50ms
+
+_STOP = object()
+
+_running = False
+_queues: dict[str, asyncio.Queue] = {}
+_tasks: list[asyncio.Task] = []
+
+
+def enqueue(collection: str, doc: dict) -> bool:
+    """
+    문서를 저장 대기열에 추가합니다.
+    flusher가 실행 중이 아니거나 대기열이 가득 차면 False를 반환하므로,
+    호출하는 쪽에서 직접 저장해야 합니다.
+    """
+    if not _running:
+        return False
+
+    queue = _queues.get(collection)
+    if queue is None:
+        queue = _queues[collection] = asyncio.Queue(maxsize=_QUEUE_SIZE)
+        _tasks.append(asyncio.create_task(_flush_loop(collection, queue)))
+
+    try:
+        queue.put_nowait(doc)
+    except asyncio.QueueFull:
+        logger.warning("히스토리 대기열이 가득 찼습니다: collection=%s", collection)
+        return False
+    return True
+
+
+async def _flush_loop(collection: str, queue: asyncio.Queue) -> None:
+    """대기열의 문서를 모아서 저장합니다. _STOP을 받으면 남은 문서를 저장하고 종료합니다."""
+    while True:
+        doc = await queue.get()
+        if doc is _STOP:
+            return
+
+        # 첫 문서가 들어온 뒤 잠시 기다려 같은 batch로 묶일 문서를 모읍니다.
+        await asyncio.sleep(_FLUSH_INTERVAL)
+        batch = [doc]
+        stop = False
+        while len(batch) < _BATCH_SIZE:
+            try:
+                doc = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if doc is _STOP:
+                stop = True
+                break
+            batch.append(doc)
+
+        await _write(collection, batch)
+        if stop:
+            return
+
+
+async def _write(collection: str, batch: list[dict]) -> None:
+    db = await get_database()
+    try:
+        await db[collection].insert_many(batch, ordered=False)
+    except Exception:
+        logger.exception(
+            "히스토리 저장 실패: collection=%s count=%d", collection, len(batch)
+        )
+
+
+async def startup() -> None:
+    """서버 시작 시 히스토리 버퍼링을 시작합니다."""
+    global _running
+    _running = True
+
+
+async def shutdown() -> None:
+    """서버 종료 시 대기 중인 문서를 모두 저장한 뒤 flusher를 종료합니다."""
+    global _running
+    _running = False
+    for queue in _queues.values():
+        await queue.put(_STOP)
+    await asyncio.gather(*_tasks)
+    _tasks.clear()
+    _queues.clear()
@@ -9,21 +9,24 @@ logger = logging.getLogger(__name__)
 # Motor(pymongo)는 내부적으로 connection pooling을 지원합니다.
 # maxPoolSize로 최대 connection 수를 제한하고,
 # minPoolSize로 유휴 상태에서도 유지할 최소 connection 수를 설정합니다.
+# maxIdleTimeMS 동안 사용되지 않은 connection은 minPoolSize까지 정리됩니다.
+# compressors는 wire protocol 압축으로, 서버가 지원하는 첫 번째 방식을 사용합니다.
+# - zstd: pymongo[zstd] extra가 설치하는 backports.zstd
+#         (Python 3.14 이상은 표준 라이브러리 compression.zstd 사용)
+# - zlib: 표준 라이브러리
 _client = AsyncIOMotorClient(
-    "mongodb://{user}:{passwd}@{host}:{port}".format(
-        user=settings.mongodb.user,
-        passwd=settings.mongodb.passwd,
-        host=settings.mongodb.host,
-        port=settings.mongodb.port,
-    ),
-    maxPoolSize=10,
+    settings.mongodb.uri,
+    maxPoolSize=settings.mongodb.max_pool_size,
     minPoolSize=10,
+    maxIdleTimeMS=60000,
+    serverSelectionTimeoutMS=3000,
+    compressors="zstd,zlib",
 )
 
 _database: AsyncIOMotorDatabase = _client[settings.mongodb.db]
 
 
-def get_database() -> AsyncIOMotorDatabase:
+async def get_database() -> AsyncIOMotorDatabase:
     """
     `db: AsyncIOMotorDatabase = Depends(get_database)`로 사용
     """
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import sys
 from typing import AsyncGenerator
@@ -24,11 +25,13 @@ _engine = create_async_engine(
         port=settings.mysql.port,
         db=settings.mysql.db,
     ),
-    pool_size=10,
-    max_overflow=0,
-    echo=True,
-    pool_pre_ping=True,
-    pool_timeout=600,
+    pool_size=settings.mysql.pool_size,
+    max_overflow=settings.mysql.max_overflow,
+    echo=settings.mysql.echo,
+    pool_pre_ping=settings.mysql.pool_pre_ping,
+    pool_recycle=settings.mysql.pool_recycle,
+    pool_timeout=settings.mysql.pool_timeout,
+    pool_use_lifo=settings.mysql.pool_use_lifo,
 )
 
 _async_session = async_sessionmaker(
@@ -107,6 +110,30 @@ async def startup() -> None:
         await conn.run_sync(Base.metadata.create_all)
         logger.info("MySQL 테이블 초기화 완료")
 
+    await _warmup_pool()
+
+
+async def _warmup_pool() -> None:
+    """
+    connection pool은 처음 사용할 때 connection을 생성하므로,
+    pool_size만큼 미리 동시에 연결한 뒤 반환해 첫 요청들의 연결(TCP + 인증) 지연을 없앱니다.
+    일부 연결이 실패해도 이미 연결된 connection은 모두 pool에 반환합니다.
+    """
+    conns = []
+
+    async def _connect() -> None:
+        # _engine.connect()는 coroutine이 아닌 AsyncConnection을 반환하므로 감싸서 await합니다.
+        conns.append(await _engine.connect())
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(settings.mysql.pool_size):
+                tg.create_task(_connect())
+    finally:
+        for conn in conns:
+            await conn.close()
+    logger.info("MySQL connection pool 준비 완료: %d개", len(conns))
+
 
 async def shutdown() -> None:
     """서버 종료 시 MySQL 연결 풀을 반환합니다."""
@@ -15,7 +15,7 @@ _client = AsyncOpenSearch(
 )
 
 
-def get_client() -> AsyncOpenSearch:
+async def get_client() -> AsyncOpenSearch:
     """
     `client: AsyncOpenSearch = Depends(get_client)`로 사용
     """
@@ -11,20 +11,21 @@ logger = logging.getLogger(__name__)
 # heartbeat 및 reconnect를 관리합니다.
 _connection: aio_pika.abc.AbstractRobustConnection | None = None
 _channel: aio_pika.abc.AbstractRobustChannel | None = None
+# 선언한 exchange를 캐싱하여 publish마다 declare_exchange round-trip을 생략합니다.
+# robust channel에서 선언한 exchange는 reconnect 시 aio_pika가 다시 선언해줍니다.
+_exchanges: dict[str, aio_pika.abc.AbstractExchange] = {}
 
 
 async def startup() -> None:
-    """서버 시작 시 RabbitMQ에 연결합니다."""
+    """
+    서버 시작 시 RabbitMQ에 연결합니다.
+    설정된 exchange를 미리 선언해 첫 publish가 선언 round-trip을 기다리지 않게 합니다.
+    """
     global _connection, _channel
-    _connection = await aio_pika.connect_robust(
-        "amqp://{user}:{passwd}@{host}:{port}/".format(
-            user=settings.rabbitmq.user,
-            passwd=settings.rabbitmq.passwd,
-            host=settings.rabbitmq.host,
-            port=settings.rabbitmq.port,
-        ),
-    )
-    _channel = await _connection.channel()
+    _connection = await aio_pika.connect_robust(settings.rabbitmq.uri)
+    # publisher confirm: broker가 메시지를 받았는지 확인한 뒤 publish가 반환됩니다.
+    _channel = await _connection.channel(publisher_confirms=True)
+    await _get_exchange(settings.consumer.exchange_name)
     logger.info("RabbitMQ 연결 완료")
 
 
@@ -37,6 +38,18 @@ async def shutdown() -> None:
         await _connection.close()
     _channel = None
     _connection = None
+    _exchanges.clear()
+
+
+async def _get_exchange(exchange_name: str) -> aio_pika.abc.AbstractExchange:
+    """캐싱된 exchange를 반환하고, 없으면 선언 후 캐싱합니다."""
+    exchange = _exchanges.get(exchange_name)
+    if exchange is None:
+        exchange = await _channel.declare_exchange(
+            exchange_name, aio_pika.ExchangeType.TOPIC, durable=True
+        )
+        _exchanges[exchange_name] = exchange
+    return exchange
 
 
 async def publish(exchange_name: str, routing_key: str, message: str):
@@ -46,9 +59,7 @@ async def publish(exchange_name: str, routing_key: str, message: str):
     if not _channel:
         raise RuntimeError("RabbitMQ 연결이 되어있지 않습니다.")
 
-    exchange = await _channel.declare_exchange(
-        exchange_name, aio_pika.ExchangeType.TOPIC, durable=True
-    )
+    exchange = await _get_exchange(exchange_name)
     await exchange.publish(
         aio_pika.Message(body=message.encode()),
         routing_key=routing_key,
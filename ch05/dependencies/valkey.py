@@ -1,6 +1,9 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import redis.asyncio as aioredis
+from fastapi import HTTPException
 
 from ch05.config.config import settings
 
@@ -9,18 +12,52 @@ logger = logging.getLogger(__name__)
 # Valkey는 Redis 프로토콜 호환이므로 redis-py 클라이언트를 사용합니다.
 # redis.asyncio의 ConnectionPool은 max_connections만 지원하고 min 설정은 없습니다.
 # 커넥션은 요청 시 생성되고 max_connections까지 풀에 유지됩니다.
-_pool = aioredis.ConnectionPool(
+# RESP 파싱은 redis[hiredis]로 설치된 C 파서(hiredis)를 redis-py가 자동으로 사용합니다.
+# BlockingConnectionPool은 max_connections에 도달하면 새 connection을 만들지 않고
+# timeout(초)까지 반환을 기다리므로, 부하 급증 시 connection 폭증을 막아줍니다.
+# socket_keepalive/health_check_interval로 유휴 connection의 끊김을 미리 감지합니다.
+_pool = aioredis.BlockingConnectionPool(
     host=settings.valkey.host,
     port=settings.valkey.port,
     password=settings.valkey.passwd,
-    max_connections=10,
+    max_connections=settings.valkey.max_connections,
+    timeout=5,
+    socket_keepalive=True,
+    health_check_interval=30,
     decode_responses=True,
 )
 
 _client = aioredis.Redis(connection_pool=_pool)
 
 
-def get_client() -> aioredis.Redis:
+async def try_acquire(client: aioredis.Redis, key: str, ttl: int) -> bool:
+    """
+    `SET key 1 NX EX ttl` 한 번으로 key를 선점합니다.
+    EXISTS 후 SETEX 하는 방식과 달리 원자적이며 round-trip도 한 번입니다.
+    이미 key가 있으면 False를 반환합니다.
+    """
+    return await client.set(key, "1", nx=True, ex=ttl) is True
+
+
+@asynccontextmanager
+async def rate_limit(
+    client: aioredis.Redis, key: str, ttl: int, detail: str
+) -> AsyncIterator[None]:
+    """
+    Valkey 기반 rate limit.
+    key를 선점하지 못하면 429를 반환하고,
+    처리 중 예외(404/403 등)가 발생하면 key를 해제해 다시 시도할 수 있게 합니다.
+    """
+    if not await try_acquire(client, key, ttl):
+        raise HTTPException(status_code=429, detail=detail)
+    try:
+        yield
+    except BaseException:
+        await client.delete(key)
+        raise
+
+
+async def get_client() -> aioredis.Redis:
     """
     `client: Redis = Depends(get_client)`로 사용
     """
@@ -1,16 +1,35 @@
-import json
+import asyncio
+import functools
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from typing import Any, Callable, Coroutine
 
-from fastapi import Depends, FastAPI
+import orjson
+from fastapi import APIRouter, Depends, FastAPI, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.docs import (
+    get_redoc_html,
+    get_swagger_ui_html,
+    get_swagger_ui_oauth2_redirect_html,
+)
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from pydantic import BaseModel
-from sqlalchemy import select
+from pymongo import IndexModel
+from sqlalchemy import select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ch05.dependencies import mongodb, mysql, opensearch, rabbitmq, s3, valkey
+from ch05.dependencies import (
+    history_buffer,
+    mongodb,
+    mysql,
+    opensearch,
+    rabbitmq,
+    s3,
+    valkey,
+)
 from ch05.dependencies.mongodb import get_database
 from ch05.dependencies.mysql import get_session
 
@@ -54,7 +73,7 @@ async def _create_master_admin() -> None:
             email=settings.admin.email,
             role=UserRole.admin,
         )
-        admin.set_password(settings.admin.password)
+        await admin.aset_password(settings.admin.password)
         session.add(admin)
         await session.commit()
         logger.info("마스터 admin 계정 생성 완료: %s", settings.admin.username)
@@ -84,26 +103,162 @@ async def _init_opensearch_index() -> None:
     logger.info("OpenSearch 인덱스 생성 완료: %s", index_name)
 
 
-@asynccontextmanager
-async def lifespan(_app: FastAPI):
+# 광고 히스토리는 90일이 지나면 TTL 인덱스로 자동 삭제해 collection 크기를 제한합니다.
+_HISTORY_TTL_SECONDS = 90 * 24 * 60 * 60
+
+
+async def _init_mongo_indexes() -> None:
+    """MongoDB 인덱스를 생성합니다 (이미 존재하면 스킵)."""
+    from ch05.routers.advertisement import _CLICK_HISTORY, _VIEW_HISTORY
+
+    db = await get_database()
+    # collection별 조회용 인덱스는 create_indexes 한 번으로 생성합니다.
+    history_indexes = [
+        # 날짜 범위 $match 후 집계에 필요한 필드를 모두 포함하여 covered query로 처리합니다.
+        IndexModel(
+            [("created_date", 1), ("ad_id", 1), ("username", 1), ("client_ip", 1)]
+        ),
+        # 광고별 최신 히스토리 조회용
+        IndexModel([("ad_id", 1), ("created_date", -1)]),
+    ]
+    # TTL 인덱스는 단일 필드 인덱스만 가능하므로 복합 인덱스와 별도로 생성합니다.
+    history_ttl_index = IndexModel(
+        [("created_date", 1)], expireAfterSeconds=_HISTORY_TTL_SECONDS
+    )
+    await asyncio.gather(
+        db[_VIEW_HISTORY].create_indexes(history_indexes),
+        db[_CLICK_HISTORY].create_indexes(history_indexes),
+        db[_VIEW_HISTORY].create_indexes([history_ttl_index]),
+        db[_CLICK_HISTORY].create_indexes([history_ttl_index]),
+        # 사용자별 최신 알림 조회용
+        db["userNotificationHistory"].create_indexes(
+            [IndexModel([("userId", 1), ("createdDate", -1)])]
+        ),
+    )
+    logger.info("MongoDB 인덱스 생성 완료")
+
+
+async def _startup_mysql() -> None:
     await mysql.startup()
     await _create_master_admin()
+
+
+async def _startup_opensearch() -> None:
     await opensearch.startup()
     await _init_opensearch_index()
-    await valkey.startup()
+
+
+async def _startup_mongodb() -> None:
     await mongodb.startup()
-    await rabbitmq.startup()
-    await s3.startup()
+    await _init_mongo_indexes()
+
+
+async def _calibrate_bcrypt() -> None:
+    """설정된 경우 서버 성능에 맞는 bcrypt cost를 측정해 적용합니다."""
+    from ch05.config.config import settings
+    from ch05.models import user as user_model
+
+    if settings.bcrypt.calibrate:
+        user_model.BCRYPT_ROUNDS = await asyncio.to_thread(
+            user_model.calibrate_bcrypt_rounds, settings.bcrypt.target_ms
+        )
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # 마스터 admin 생성 시 비밀번호를 해시하므로 cost를 먼저 결정합니다.
+    await _calibrate_bcrypt()
+    # 서로 독립적인 저장소는 동시에 초기화합니다 (순서가 필요한 작업만 묶어서 실행).
+    await asyncio.gather(
+        _startup_mysql(),
+        _startup_opensearch(),
+        _startup_mongodb(),
+        valkey.startup(),
+        rabbitmq.startup(),
+        s3.startup(),
+    )
+    await history_buffer.startup()
     yield
-    await rabbitmq.shutdown()
-    await mongodb.shutdown()
-    await valkey.shutdown()
-    await opensearch.shutdown()
-    await mysql.shutdown()
+    # 버퍼에 남은 히스토리를 MongoDB에 저장한 뒤 나머지 연결을 동시에 닫습니다.
+    await history_buffer.shutdown()
+    results = await asyncio.gather(
+        rabbitmq.shutdown(),
+        mongodb.shutdown(),
+        valkey.shutdown(),
+        opensearch.shutdown(),
+        mysql.shutdown(),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("종료 처리 실패: %r", result)
+
+
+# 응답 JSON 직렬화에 stdlib json 대신 orjson을 사용합니다.
+# 문서 페이지는 아래에서 미리 생성한 HTML로 직접 등록합니다.
+app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    docs_url=None,
+    redoc_url=None,
+)
+
+# Swagger UI/ReDoc HTML은 root_path별로 내용이 같으므로 요청마다 만들지 않고 캐싱합니다.
+# (FastAPI 기본 핸들러와 같이 proxy 등으로 설정된 root_path를 openapi.json 경로 앞에 붙입니다.)
+_DOCS_HEADERS = {"Cache-Control": "public, max-age=3600"}
+_SWAGGER_UI_REDIRECT_HTML = get_swagger_ui_oauth2_redirect_html().body
+
+
+@functools.lru_cache(maxsize=8)
+def _swagger_ui_html(root_path: str) -> bytes:
+    oauth2_redirect_url = app.swagger_ui_oauth2_redirect_url
+    if oauth2_redirect_url:
+        oauth2_redirect_url = root_path + oauth2_redirect_url
+    return get_swagger_ui_html(
+        openapi_url=root_path + app.openapi_url,
+        title=f"{app.title} - Swagger UI",
+        oauth2_redirect_url=oauth2_redirect_url,
+        init_oauth=app.swagger_ui_init_oauth,
+        swagger_ui_parameters=app.swagger_ui_parameters,
+    ).body
+
 
+@functools.lru_cache(maxsize=8)
+def _redoc_html(root_path: str) -> bytes:
+    return get_redoc_html(
+        openapi_url=root_path + app.openapi_url, title=f"{app.title} - ReDoc"
+    ).body
 
-app = FastAPI(lifespan=lifespan)
 
+def _root_path(request: Request) -> str:
+    return request.scope.get("root_path", "").rstrip("/")
+
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui_html(request: Request) -> Response:
+    return Response(
+        _swagger_ui_html(_root_path(request)),
+        media_type="text/html",
+        headers=_DOCS_HEADERS,
+    )
+
+
+@app.get(app.swagger_ui_oauth2_redirect_url, include_in_schema=False)
+async def swagger_ui_redirect() -> Response:
+    return Response(
+        _SWAGGER_UI_REDIRECT_HTML, media_type="text/html", headers=_DOCS_HEADERS
+    )
+
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc_html(request: Request) -> Response:
+    return Response(
+        _redoc_html(_root_path(request)), media_type="text/html", headers=_DOCS_HEADERS
+    )
+
+
+# CORSMiddleware는 pure ASGI middleware입니다.
+# middleware를 추가할 때는 BaseHTTPMiddleware를 사용하지 않습니다 (ruff TID251로 금지).
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -127,14 +282,43 @@ async def health_check() -> str:
     return "ok"
 
 
+class ORJSONRequest(Request):
+    """요청 body JSON을 stdlib json 대신 orjson으로 파싱하는 Request"""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """
+    FastAPI는 body 파싱에 request.json()을 사용하므로 ORJSONRequest로 교체합니다.
+    orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스라 422 처리도 동일합니다.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+
+# consumer가 메시지마다 호출하는 내부 API
+internal_router = APIRouter(
+    prefix="/internal", tags=["Internal"], route_class=ORJSONRoute
+)
+
+
 class MessagePayload(BaseModel):
     routing_key: str
     body: str
 
 
-@app.post(
-    "/internal/messages",
-    tags=["Internal"],
+@internal_router.post(
+    "/messages",
     summary="Consumer로부터 전달받은 RabbitMQ 메시지를 처리합니다.",
 )
 async def process_message(
@@ -142,20 +326,51 @@ async def process_message(
     session: AsyncSession = Depends(get_session),
     db: AsyncIOMotorDatabase = Depends(get_database),
 ) -> str:
-    body = json.loads(payload.body)
+    return await _handle_message(payload.routing_key, payload.body, session, db)
+
+
+@internal_router.post(
+    "/messages/raw",
+    summary="Consumer로부터 전달받은 RabbitMQ 메시지 body를 그대로 처리합니다.",
+)
+async def process_raw_message(
+    request: Request,
+    x_routing_key: str = Header(),
+    session: AsyncSession = Depends(get_session),
+    db: AsyncIOMotorDatabase = Depends(get_database),
+) -> str:
+    """
+    큰 메시지는 consumer가 body bytes를 decode/JSON 재인코딩 없이 그대로 전달합니다.
+    routing_key는 X-Routing-Key 헤더로 받습니다.
+    """
+    return await _handle_message(x_routing_key, await request.body(), session, db)
+
+
+app.include_router(internal_router)
+
+
+async def _handle_message(
+    routing_key: str,
+    raw_body: str | bytes,
+    session: AsyncSession,
+    db: AsyncIOMotorDatabase,
+) -> str:
+    body = orjson.loads(raw_body)
     msg_type = body.get("type")
 
     if msg_type == "write_article":
         article_id = body["article_id"]
         user_id = body["user_id"]
-        article = await session.scalar(
-            select(Article).where(Article.id == article_id, Article.is_deleted == False)
+        title = await session.scalar(
+            select(Article.title).where(
+                Article.id == article_id, Article.is_deleted == False
+            )
         )
-        if article:
+        if title is not None:
             await db["userNotificationHistory"].insert_one(
                 {
                     "title": "글이 작성되었습니다.",
-                    "content": article.title,
+                    "content": title,
                     "userId": user_id,
                     "isRead": False,
                     "createdDate": datetime.now(timezone.utc),
@@ -165,47 +380,48 @@ async def process_message(
 
     elif msg_type == "write_comment":
         comment_id = body["comment_id"]
-        comment = await session.scalar(
-            select(Comment).where(Comment.id == comment_id, Comment.is_deleted == False)
-        )
+        comment = (
+            await session.execute(
+                select(Comment.author_id, Comment.article_id, Comment.content).where(
+                    Comment.id == comment_id, Comment.is_deleted == False
+                )
+            )
+        ).first()
         if comment is None:
             return "ok"
 
         # 알림 대상: 댓글 작성자 + 게시글 작성자 + 해당 게시글의 모든 댓글 작성자
-        user_ids: set[int] = set()
-        if comment.author_id is not None:
-            user_ids.add(comment.author_id)
-
-        article = await session.scalar(
-            select(Article).where(
-                Article.id == comment.article_id, Article.is_deleted == False
-            )
-        )
-        if article and article.author_id is not None:
-            user_ids.add(article.author_id)
-
-        other_comments = await session.scalars(
-            select(Comment).where(
-                Comment.article_id == comment.article_id,
-                Comment.is_deleted == False,
+        # 게시글 작성자와 댓글 작성자들을 UNION ALL 한 번의 쿼리로 조회합니다.
+        author_ids = await session.scalars(
+            union_all(
+                select(Comment.author_id).where(
+                    Comment.article_id == comment.article_id,
+                    Comment.is_deleted == False,
+                ),
+                select(Article.author_id).where(
+                    Article.id == comment.article_id, Article.is_deleted == False
+                ),
             )
         )
-        for c in other_comments.all():
-            if c.author_id is not None:
-                user_ids.add(c.author_id)
+        user_ids: set[int] = {uid for uid in author_ids if uid is not None}
+        if comment.author_id is not None:
+            user_ids.add(comment.author_id)
 
+        # 대상 사용자별 알림을 insert_many 한 번으로 저장합니다.
         now = datetime.now(timezone.utc)
-        for uid in user_ids:
-            await db["userNotificationHistory"].insert_one(
-                {
-                    "title": "댓글이 작성되었습니다.",
-                    "content": comment.content,
-                    "userId": uid,
-                    "isRead": False,
-                    "createdDate": now,
-                    "updatedDate": now,
-                }
-            )
+        docs = [
+            {
+                "title": "댓글이 작성되었습니다.",
+                "content": comment.content,
+                "userId": uid,
+                "isRead": False,
+                "createdDate": now,
+                "updatedDate": now,
+            }
+            for uid in user_ids
+        ]
+        if docs:
+            await db["userNotificationHistory"].insert_many(docs, ordered=False)
 
-    logger.info("메시지 처리: routing_key=%s type=%s", payload.routing_key, msg_type)
+    logger.info("메시지 처리: routing_key=%s type=%s", routing_key, msg_type)
     return "ok"
@@ -1,12 +1,73 @@
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum, auto
 
-from passlib.context import CryptContext
-from sqlalchemy import Column, DateTime, Enum, String
+import bcrypt
+from sqlalchemy import CHAR, Column, DateTime, Enum, String
 
+from ch05.config.config import settings
 from ch05.dependencies.mysql import Base
 from ch05.models.mixin import BaseMixin
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
+
+# passlib(CryptContext)을 거치지 않고 bcrypt(C 구현)를 직접 호출합니다.
+# passlib이 생성한 기존 해시($2b$)와 호환됩니다.
+BCRYPT_ROUNDS = settings.bcrypt.rounds
+_BCRYPT_MIN_ROUNDS = 4
+_BCRYPT_MAX_ROUNDS = 31
+
+
+def calibrate_bcrypt_rounds(target_ms: int = 250, min_rounds: int | None = None) -> int:
+    """
+    해시 1회가 target_ms 이상 걸리는 가장 작은 cost를 측정합니다.
+    결과는 min_rounds(기본값: settings.bcrypt.rounds)보다 작아지지 않으므로,
+    target_ms를 너무 작게 설정해도 설정된 cost보다 약해지지 않습니다.
+    cost가 1 증가할 때마다 시간이 2배가 되므로 전체 측정 시간은 약 target_ms의 2배입니다.
+    """
+    if min_rounds is None:
+        min_rounds = settings.bcrypt.rounds
+    min_rounds = max(min_rounds, _BCRYPT_MIN_ROUNDS)
+
+    for rounds in range(min_rounds, _BCRYPT_MAX_ROUNDS + 1):
+        start = time.perf_counter()
+        bcrypt.hashpw(b"calibrate", bcrypt.gensalt(rounds=rounds))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms >= target_ms:
+            logger.info("bcrypt cost 측정 완료: rounds=%d (%.0fms)", rounds, elapsed_ms)
+            return rounds
+    return _BCRYPT_MAX_ROUNDS
+
+
+def _hash_password(plain_password: str) -> str:
+    return bcrypt.hashpw(
+        plain_password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    ).decode("ascii")
+
+
+def _verify_password(plain_password: str, hashed_password: str | None) -> bool:
+    if hashed_password is None:
+        return False
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8"), hashed_password.encode("ascii")
+    )
+
+
+# 대량 가입/재해시처럼 여러 비밀번호를 한 번에 처리할 때 사용합니다.
+# 해시마다 독립적이고 bcrypt는 GIL을 해제하므로 thread pool로 CPU core 수만큼 병렬 처리됩니다.
+def hash_many(passwords: list[str]) -> list[str]:
+    """비밀번호 목록을 병렬로 해시합니다 (입력 순서 유지)."""
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(_hash_password, passwords))
+
+
+def verify_many(pairs: list[tuple[str, str | None]]) -> list[bool]:
+    """(평문, 해시) 목록을 병렬로 검증합니다 (입력 순서 유지)."""
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(lambda pair: _verify_password(*pair), pairs))
 
 
 class UserRole(StrEnum):
@@ -20,12 +81,35 @@ class User(Base, BaseMixin):
 
     username = Column(String(50), unique=True, nullable=False, comment="사용자명")
     email = Column(String(100), unique=True, nullable=False, comment="이메일")
-    hashed_password = Column(String(100), comment="암호화된 비밀번호")
-    role = Column(Enum(UserRole), default=UserRole.member, comment="권한")
+    # bcrypt 해시는 항상 60자 ASCII이므로 고정 길이 + ascii_bin으로 저장합니다.
+    hashed_password = Column(
+        CHAR(60, collation="ascii_bin"), comment="암호화된 비밀번호(bcrypt)"
+    )
+    # MySQL native ENUM이 값의 범위를 검증하므로 CHECK 제약조건과
+    # 문자열 재검증은 생략합니다. (생성되는 DDL은 이전과 동일합니다.)
+    role = Column(
+        Enum(
+            UserRole,
+            native_enum=True,
+            create_constraint=False,
+            validate_strings=False,
+            values_callable=lambda e: [m.value for m in e],
+        ),
+        default=UserRole.member,
+        comment="권한",
+    )
     last_login = Column(DateTime, nullable=True, comment="마지막 로그인 시각")
 
     def set_password(self, plain_password):
-        self.hashed_password = pwd_context.hash(plain_password)
+        self.hashed_password = _hash_password(plain_password)
 
     def verify_password(self, plain_password):
-        return pwd_context.verify(plain_password, self.hashed_password)
+        return _verify_password(plain_password, self.hashed_password)
+
+    # bcrypt 해시는 수백 ms가 걸리는 CPU 작업이므로 async 코드에서는 아래 메서드를 사용합니다.
+    # bcrypt C 구현은 실행 중 GIL을 해제하므로 thread에서 실행하면 event loop가 막히지 않습니다.
+    async def aset_password(self, plain_password):
+        self.hashed_password = await asyncio.to_thread(_hash_password, plain_password)
+
+    async def averify_password(self, plain_password):
+        return await asyncio.to_thread(self.verify_password, plain_password)
@@ -1,15 +1,16 @@
-import json
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, time, timedelta, timezone
 from typing import Optional
 
 import redis.asyncio as aioredis
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ch05.dependencies import history_buffer
 from ch05.dependencies.auth import get_current_user, get_optional_user
 from ch05.dependencies.mongodb import get_database
 from ch05.dependencies.mysql import get_session
@@ -19,8 +20,16 @@ from ch05.models.user import User, UserRole
 
 logger = logging.getLogger(__name__)
 
-_AD_CACHE_KEY = "ad:{ad_id}"
+# Hash로 캐싱합니다. 이전 버전이 JSON 문자열로 저장한 "ad:{ad_id}" key와 겹치면
+# HGETALL/HSET이 WRONGTYPE 에러를 내므로 다른 prefix를 사용합니다.
+_AD_CACHE_KEY = "adh:{ad_id}"
 _AD_CACHE_TTL = 3600  # 1시간
+# Valkey 앞단의 프로세스 로컬 캐시. hot 광고는 Valkey round-trip 없이 응답합니다.
+# 광고는 등록 후 API로 수정/삭제되지 않으므로 무효화 없이 TTL로만 관리하며,
+# DB를 직접 수정한 경우에도 TTL이 지나면 반영됩니다.
+_local_ads: TTLCache[int, "AdResponse"] = TTLCache(maxsize=4096, ttl=60)
+# 존재하지 않는 광고(404) 조회를 흡수하는 negative cache
+_local_missing: TTLCache[int, bool] = TTLCache(maxsize=1024, ttl=2)
 _VIEW_HISTORY = "adViewHistory"
 _CLICK_HISTORY = "adClickHistory"
 
@@ -58,27 +67,110 @@ class AdHistoryResult(BaseModel):
     count: int
 
 
+_AD_INT_FIELDS = ("id", "view_count", "click_count")
+_AD_BOOL_FIELDS = ("is_visible", "is_deleted")
+_AD_DATETIME_FIELDS = ("start_date", "end_date", "created_at", "updated_at")
+
+
 def _ad_to_dict(ad: Advertisement) -> dict:
-    return {
-        "id": ad.id,
-        "title": ad.title,
-        "content": ad.content,
-        "is_visible": ad.is_visible,
-        "is_deleted": ad.is_deleted,
-        "start_date": ad.start_date.isoformat() if ad.start_date else None,
-        "end_date": ad.end_date.isoformat() if ad.end_date else None,
-        "view_count": ad.view_count,
-        "click_count": ad.click_count,
-        "created_at": ad.created_at.isoformat() if ad.created_at else None,
-        "updated_at": ad.updated_at.isoformat() if ad.updated_at else None,
-    }
+    """ORM 객체에서 AdResponse 필드 값을 한 번만 읽어 dict로 만듭니다."""
+    return {field: getattr(ad, field) for field in AdResponse.model_fields}
+
+
+def _ad_to_hash(values: dict) -> dict[str, str | int]:
+    """
+    광고를 Valkey Hash 필드로 변환합니다.
+    Hash에는 None/bool/datetime을 저장할 수 없으므로
+    None은 제외하고 bool은 0/1, datetime은 ISO 8601 문자열로 저장합니다.
+    """
+    hash_values: dict[str, str | int] = {}
+    for k, v in values.items():
+        if v is None:
+            continue
+        if isinstance(v, bool):
+            v = int(v)
+        elif isinstance(v, datetime):
+            v = v.isoformat()
+        hash_values[k] = v
+    return hash_values
+
+
+def _ad_from_hash(cached: dict[str, str]) -> AdResponse:
+    """
+    Valkey Hash를 AdResponse로 변환합니다.
+    캐시는 서버가 직접 저장한 값이므로 pydantic 검증 없이 model_construct로 생성합니다.
+    """
+    values = {"title": cached["title"], "content": cached["content"]}
+    for field in _AD_INT_FIELDS:
+        values[field] = int(cached[field])
+    for field in _AD_BOOL_FIELDS:
+        values[field] = cached[field] == "1"
+    for field in _AD_DATETIME_FIELDS:
+        value = cached.get(field)
+        values[field] = datetime.fromisoformat(value) if value else None
+    return AdResponse.model_construct(**values)
+
+
+async def _cache_ad(valkey: aioredis.Redis, values: dict) -> None:
+    """광고를 Valkey Hash로 캐싱합니다 (HSET + EXPIRE를 pipeline 한 번으로 전송)."""
+    key = _AD_CACHE_KEY.format(ad_id=values["id"])
+    async with valkey.pipeline(transaction=False) as pipe:
+        pipe.hset(key, mapping=_ad_to_hash(values))
+        pipe.expire(key, _AD_CACHE_TTL)
+        await pipe.execute()
+
+
+async def _load_ad(
+    ad_id: int, session: AsyncSession, valkey: aioredis.Redis
+) -> AdResponse:
+    """
+    로컬 캐시 → Valkey 캐시 → DB 순으로 광고를 조회합니다.
+    존재하지 않는 광고도 짧게 로컬 캐싱해 반복 조회가 Valkey/DB로 가지 않게 합니다.
+    """
+    ad_response = _local_ads.get(ad_id)
+    if ad_response is not None:
+        return ad_response
+    if ad_id in _local_missing:
+        raise HTTPException(status_code=404, detail="Advertisement not found")
+
+    key = _AD_CACHE_KEY.format(ad_id=ad_id)
+    cached = await valkey.hgetall(key)
+    if cached:
+        logger.debug("광고 캐시 히트: ad_id=%d", ad_id)
+        ad_response = _ad_from_hash(cached)
+    else:
+        # PK 조회는 session.get으로 identity map을 먼저 확인합니다.
+        ad = await session.get(Advertisement, ad_id)
+        if ad is None or ad.is_deleted:
+            _local_missing[ad_id] = True
+            raise HTTPException(status_code=404, detail="Advertisement not found")
+
+        # DB에서 읽은 값은 검증할 필요가 없으므로 dict 하나로 캐싱과 응답을 함께 만듭니다.
+        values = _ad_to_dict(ad)
+        await _cache_ad(valkey, values)
+        ad_response = AdResponse.model_construct(**values)
+
+    _local_ads[ad_id] = ad_response
+    return ad_response
+
+
+def _record_history(
+    background: BackgroundTasks,
+    db: AsyncIOMotorDatabase,
+    collection: str,
+    doc: dict,
+) -> None:
+    """
+    히스토리를 history_buffer에 넣어 insert_many로 모아서 저장합니다.
+    버퍼를 사용할 수 없으면 응답 전송 후 background task로 insert_one 합니다.
+    """
+    if not history_buffer.enqueue(collection, doc):
+        background.add_task(db[collection].insert_one, doc)
 
 
 def _yesterday_range() -> tuple[datetime, datetime]:
     """어제 00:00 ~ 오늘 00:00 범위를 반환합니다 (UTC 기준)."""
-    today = datetime.now(timezone.utc).replace(
-        hour=0, minute=0, second=0, microsecond=0, tzinfo=None
-    )
+    today = datetime.combine(datetime.now(timezone.utc).date(), time.min)
     return today - timedelta(days=1), today
 
 
@@ -88,15 +180,16 @@ async def _get_history_stats(
     """MongoDB Aggregation으로 어제 기준 유니크 사용자/IP 수를 집계합니다."""
     start, end = _yesterday_range()
 
-    # 로그인 사용자(username 있음) 집계
-    pipeline_user = [
+    # 로그인 사용자는 username, 익명 사용자는 client_ip를 식별자로 사용하여
+    # 하나의 set에 모으므로, 집계와 합산을 한 번의 $group으로 처리합니다.
+    pipeline = [
+        {"$match": {"created_date": {"$gte": start, "$lt": end}}},
         {
-            "$match": {
-                "created_date": {"$gte": start, "$lt": end},
-                "username": {"$exists": True, "$ne": None},
+            "$group": {
+                "_id": "$ad_id",
+                "unique_vals": {"$addToSet": {"$ifNull": ["$username", "$client_ip"]}},
             }
         },
-        {"$group": {"_id": "$ad_id", "unique_vals": {"$addToSet": "$username"}}},
         {
             "$project": {
                 "ad_id": "$_id",
@@ -105,37 +198,9 @@ async def _get_history_stats(
             }
         },
     ]
-    # 익명 사용자(username 없음) 집계 — client_ip로 중복 제거
-    pipeline_anon = [
-        {
-            "$match": {
-                "created_date": {"$gte": start, "$lt": end},
-                "$or": [
-                    {"username": {"$exists": False}},
-                    {"username": None},
-                ],
-            }
-        },
-        {"$group": {"_id": "$ad_id", "unique_vals": {"$addToSet": "$client_ip"}}},
-        {
-            "$project": {
-                "ad_id": "$_id",
-                "count": {"$size": "$unique_vals"},
-                "_id": 0,
-            }
-        },
-    ]
-
-    results_user = await db[collection].aggregate(pipeline_user).to_list(None)
-    results_anon = await db[collection].aggregate(pipeline_anon).to_list(None)
-
-    total: dict[int, int] = {}
-    for r in results_user:
-        total[r["ad_id"]] = r["count"]
-    for r in results_anon:
-        total[r["ad_id"]] = total.get(r["ad_id"], 0) + r["count"]
 
-    return [AdHistoryResult(ad_id=ad_id, count=count) for ad_id, count in total.items()]
+    results = await db[collection].aggregate(pipeline).to_list(None)
+    return [AdHistoryResult(**r) for r in results]
 
 
 # ─── 히스토리 라우트 (/{ad_id} 보다 먼저 등록) ───────────────────────────────
@@ -163,11 +228,12 @@ async def get_click_history(
 @router.post("", response_model=AdResponse, status_code=201)
 async def write_ad(
     body: WriteAdRequest,
+    background: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
     valkey: aioredis.Redis = Depends(get_valkey_client),
 ) -> Advertisement:
-    """광고 등록 (admin 전용). 등록 후 Valkey에 캐싱합니다."""
+    """광고 등록 (admin 전용). 응답 후 Valkey에 캐싱합니다."""
     if current_user.role != UserRole.admin:
         raise HTTPException(
             status_code=403, detail="관리자만 광고를 등록할 수 있습니다."
@@ -186,9 +252,10 @@ async def write_ad(
     await session.commit()
     await session.refresh(ad)
 
-    await valkey.setex(
-        _AD_CACHE_KEY.format(ad_id=ad.id), _AD_CACHE_TTL, json.dumps(_ad_to_dict(ad))
-    )
+    # Valkey 캐싱은 응답 전송 후 background task로 처리합니다.
+    # (캐싱 전에 조회되더라도 DB에서 읽어 다시 캐싱하므로 안전)
+    background.add_task(_cache_ad, valkey, _ad_to_dict(ad))
+    _local_missing.pop(ad.id, None)
 
     return ad
 
@@ -208,40 +275,31 @@ async def get_ads(
 async def get_ad(
     ad_id: int,
     request: Request,
+    background: BackgroundTasks,
     is_true_view: bool = Query(default=False),
     current_user: User | None = Depends(get_optional_user),
     session: AsyncSession = Depends(get_session),
     valkey: aioredis.Redis = Depends(get_valkey_client),
     db: AsyncIOMotorDatabase = Depends(get_database),
 ) -> AdResponse:
-    """광고 단건 조회. 광고 존재 확인 후 Valkey 캐시 조회 + MongoDB에 조회 히스토리 기록."""
-    key = _AD_CACHE_KEY.format(ad_id=ad_id)
-    cached = await valkey.get(key)
-    if cached:
-        logger.debug("광고 캐시 히트: ad_id=%d", ad_id)
-        ad_response = AdResponse(**json.loads(cached))
-    else:
-        ad = await session.scalar(
-            select(Advertisement).where(
-                Advertisement.id == ad_id,
-                Advertisement.is_deleted == False,
-            )
-        )
-        if ad is None:
-            raise HTTPException(status_code=404, detail="Advertisement not found")
-
-        await valkey.setex(key, _AD_CACHE_TTL, json.dumps(_ad_to_dict(ad)))
-        ad_response = AdResponse.model_validate(ad)
+    """
+    광고 단건 조회. 로컬 캐시 → Valkey 캐시 → DB 순으로 조회 + MongoDB에 조회 히스토리 기록.
+    히스토리는 응답 경로에서 MongoDB를 기다리지 않도록 _record_history로 기록합니다.
+    """
+    ad_response = await _load_ad(ad_id, session, valkey)
 
     username = current_user.username if current_user else None
-    await db[_VIEW_HISTORY].insert_one(
+    _record_history(
+        background,
+        db,
+        _VIEW_HISTORY,
         {
             "ad_id": ad_id,
             "username": username,
             "client_ip": request.client.host,
             "is_true_view": is_true_view,
             "created_date": datetime.now(timezone.utc).replace(tzinfo=None),
-        }
+        },
     )
     return ad_response
 
@@ -250,27 +308,26 @@ async def get_ad(
 async def click_ad(
     ad_id: int,
     request: Request,
+    background: BackgroundTasks,
     current_user: User | None = Depends(get_optional_user),
     session: AsyncSession = Depends(get_session),
     db: AsyncIOMotorDatabase = Depends(get_database),
 ) -> str:
-    """광고 클릭 기록. MongoDB에 클릭 히스토리를 저장합니다."""
-    ad = await session.scalar(
-        select(Advertisement).where(
-            Advertisement.id == ad_id,
-            Advertisement.is_deleted == False,
-        )
-    )
-    if ad is None:
+    """광고 클릭 기록. MongoDB에 클릭 히스토리를 저장합니다 (_record_history)."""
+    ad = await session.get(Advertisement, ad_id)
+    if ad is None or ad.is_deleted:
         raise HTTPException(status_code=404, detail="Advertisement not found")
 
     username = current_user.username if current_user else None
-    await db[_CLICK_HISTORY].insert_one(
+    _record_history(
+        background,
+        db,
+        _CLICK_HISTORY,
         {
             "ad_id": ad_id,
             "username": username,
             "client_ip": request.client.host,
             "created_date": datetime.now(timezone.utc).replace(tzinfo=None),
-        }
+        },
     )
     return "click"
@@ -16,6 +16,7 @@ from ch05.dependencies.mysql import get_session
 from ch05.dependencies.opensearch import get_client as get_os_client
 from ch05.dependencies.rabbitmq import publish as rabbitmq_publish
 from ch05.dependencies.valkey import get_client as get_valkey_client
+from ch05.dependencies.valkey import rate_limit
 from ch05.models.article import Article
 from ch05.models.board import Board
 from ch05.models.comment import Comment
@@ -66,29 +67,28 @@ class ArticleDetailResponse(ArticleResponse):
     comments: list[CommentInArticle]
 
 
-async def _check_write_rate_limit(user_id: int, client: aioredis.Redis) -> None:
-    """Valkey 기반 게시글 작성 rate limit (5분)"""
-    if await client.exists(f"rate_limit:{user_id}:article_write"):
-        raise HTTPException(
-            status_code=429, detail="게시글은 5분에 한 번만 작성할 수 있습니다."
-        )
-
+def _write_rate_limit(user_id: int, client: aioredis.Redis):
+    """게시글 작성 rate limit (5분)"""
+    return rate_limit(
+        client,
+        f"rate_limit:{user_id}:article_write",
+        _ARTICLE_WRITE_TTL,
+        "게시글은 5분에 한 번만 작성할 수 있습니다.",
+    )
 
-async def _set_write_rate_limit(user_id: int, client: aioredis.Redis) -> None:
-    await client.setex(f"rate_limit:{user_id}:article_write", _ARTICLE_WRITE_TTL, "1")
 
+def _edit_rate_limit_key(user_id: int) -> str:
+    return f"rate_limit:{user_id}:article_edit"
 
-async def _check_edit_rate_limit(user_id: int, client: aioredis.Redis) -> None:
-    """Valkey 기반 게시글 수정/삭제 rate limit (5분)"""
-    if await client.exists(f"rate_limit:{user_id}:article_edit"):
-        raise HTTPException(
-            status_code=429,
-            detail="게시글 수정/삭제는 5분에 한 번만 할 수 있습니다.",
-        )
 
-
-async def _set_edit_rate_limit(user_id: int, client: aioredis.Redis) -> None:
-    await client.setex(f"rate_limit:{user_id}:article_edit", _ARTICLE_EDIT_TTL, "1")
+def _edit_rate_limit(user_id: int, client: aioredis.Redis):
+    """게시글 수정/삭제 rate limit (5분)"""
+    return rate_limit(
+        client,
+        _edit_rate_limit_key(user_id),
+        _ARTICLE_EDIT_TTL,
+        "게시글 수정/삭제는 5분에 한 번만 할 수 있습니다.",
+    )
 
 
 async def _index_article(client: AsyncOpenSearch, article: Article) -> None:
@@ -163,19 +163,17 @@ async def write_article(
     if board is None:
         raise HTTPException(status_code=404, detail="Board not found")
 
-    await _check_write_rate_limit(current_user.id, valkey)
-
-    article = Article(
-        title=body.title,
-        content=body.content,
-        author_id=current_user.id,
-        board_id=board_id,
-    )
-    session.add(article)
-    await session.commit()
-    await session.refresh(article)
+    async with _write_rate_limit(current_user.id, valkey):
+        article = Article(
+            title=body.title,
+            content=body.content,
+            author_id=current_user.id,
+            board_id=board_id,
+        )
+        session.add(article)
+        await session.commit()
+        await session.refresh(article)
 
-    await _set_write_rate_limit(current_user.id, valkey)
     await _index_article(os_client, article)
 
     await rabbitmq_publish(
@@ -262,32 +260,32 @@ async def edit_article(
     os_client: AsyncOpenSearch = Depends(get_os_client),
     valkey: aioredis.Redis = Depends(get_valkey_client),
 ) -> Article:
-    await _check_edit_rate_limit(current_user.id, valkey)
-
-    article = await session.scalar(
-        select(Article).where(
-            Article.id == article_id,
-            Article.board_id == board_id,
-            Article.is_deleted == False,
+    async with _edit_rate_limit(current_user.id, valkey):
+        article = await session.scalar(
+            select(Article).where(
+                Article.id == article_id,
+                Article.board_id == board_id,
+                Article.is_deleted == False,
+            )
         )
-    )
-    if article is None:
-        raise HTTPException(status_code=404, detail="Article not found")
-    if article.author_id != current_user.id:
-        raise HTTPException(status_code=403, detail="수정 권한이 없습니다.")
+        if article is None:
+            raise HTTPException(status_code=404, detail="Article not found")
+        if article.author_id != current_user.id:
+            raise HTTPException(status_code=403, detail="수정 권한이 없습니다.")
 
-    if body.title is None and body.content is None:
-        return article
+        if body.title is None and body.content is None:
+            # 변경 사항이 없으면 수정 횟수로 치지 않도록 선점한 key를 해제합니다.
+            await valkey.delete(_edit_rate_limit_key(current_user.id))
+            return article
 
-    if body.title is not None:
-        article.title = body.title
-    if body.content is not None:
-        article.content = body.content
+        if body.title is not None:
+            article.title = body.title
+        if body.content is not None:
+            article.content = body.content
 
-    await session.commit()
-    await session.refresh(article)
+        await session.commit()
+        await session.refresh(article)
 
-    await _set_edit_rate_limit(current_user.id, valkey)
     await _index_article(os_client, article)
 
     return article
@@ -302,24 +300,22 @@ async def delete_article(
     os_client: AsyncOpenSearch = Depends(get_os_client),
     valkey: aioredis.Redis = Depends(get_valkey_client),
 ) -> str:
-    await _check_edit_rate_limit(current_user.id, valkey)
-
-    article = await session.scalar(
-        select(Article).where(
-            Article.id == article_id,
-            Article.board_id == board_id,
-            Article.is_deleted == False,
+    async with _edit_rate_limit(current_user.id, valkey):
+        article = await session.scalar(
+            select(Article).where(
+                Article.id == article_id,
+                Article.board_id == board_id,
+                Article.is_deleted == False,
+            )
         )
-    )
-    if article is None:
-        raise HTTPException(status_code=404, detail="Article not found")
-    if article.author_id != current_user.id:
-        raise HTTPException(status_code=403, detail="삭제 권한이 없습니다.")
+        if article is None:
+            raise HTTPException(status_code=404, detail="Article not found")
+        if article.author_id != current_user.id:
+            raise HTTPException(status_code=403, detail="삭제 권한이 없습니다.")
 
-    article.soft_delete()
-    await session.commit()
+        article.soft_delete()
+        await session.commit()
 
-    await _set_edit_rate_limit(current_user.id, valkey)
     await _delete_index(os_client, article_id)
 
     return "article is deleted"
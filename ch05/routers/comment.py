@@ -13,6 +13,7 @@ from ch05.dependencies.auth import get_current_user
 from ch05.dependencies.mysql import get_session
 from ch05.dependencies.rabbitmq import publish as rabbitmq_publish
 from ch05.dependencies.valkey import get_client as get_valkey_client
+from ch05.dependencies.valkey import rate_limit
 from ch05.models.article import Article
 from ch05.models.comment import Comment
 from ch05.models.user import User
@@ -44,28 +45,24 @@ class CommentResponse(BaseModel):
     updated_at: datetime | None
 
 
-async def _check_comment_rate_limit(user_id: int, client: aioredis.Redis) -> None:
-    """Valkey 기반 댓글 작성 rate limit (1분)"""
-    if await client.exists(f"rate_limit:{user_id}:comment_write"):
-        raise HTTPException(
-            status_code=429, detail="댓글은 1분에 한 번만 작성할 수 있습니다."
-        )
-
-
-async def _set_comment_rate_limit(user_id: int, client: aioredis.Redis) -> None:
-    await client.setex(f"rate_limit:{user_id}:comment_write", _COMMENT_WRITE_TTL, "1")
-
-
-async def _check_comment_edit_rate_limit(user_id: int, client: aioredis.Redis) -> None:
-    """Valkey 기반 댓글 수정/삭제 rate limit (1분)"""
-    if await client.exists(f"rate_limit:{user_id}:comment_edit"):
-        raise HTTPException(
-            status_code=429, detail="댓글 수정/삭제는 1분에 한 번만 할 수 있습니다."
-        )
+def _comment_rate_limit(user_id: int, client: aioredis.Redis):
+    """댓글 작성 rate limit (1분)"""
+    return rate_limit(
+        client,
+        f"rate_limit:{user_id}:comment_write",
+        _COMMENT_WRITE_TTL,
+        "댓글은 1분에 한 번만 작성할 수 있습니다.",
+    )
 
 
-async def _set_comment_edit_rate_limit(user_id: int, client: aioredis.Redis) -> None:
-    await client.setex(f"rate_limit:{user_id}:comment_edit", _COMMENT_EDIT_TTL, "1")
+def _comment_edit_rate_limit(user_id: int, client: aioredis.Redis):
+    """댓글 수정/삭제 rate limit (1분)"""
+    return rate_limit(
+        client,
+        f"rate_limit:{user_id}:comment_edit",
+        _COMMENT_EDIT_TTL,
+        "댓글 수정/삭제는 1분에 한 번만 할 수 있습니다.",
+    )
 
 
 async def _get_active_article(
@@ -92,19 +89,17 @@ async def write_comment(
     session: AsyncSession = Depends(get_session),
     valkey: aioredis.Redis = Depends(get_valkey_client),
 ) -> Comment:
-    await _check_comment_rate_limit(current_user.id, valkey)
-    await _get_active_article(board_id, article_id, session)
+    async with _comment_rate_limit(current_user.id, valkey):
+        await _get_active_article(board_id, article_id, session)
 
-    comment = Comment(
-        content=body.content,
-        author_id=current_user.id,
-        article_id=article_id,
-    )
-    session.add(comment)
-    await session.commit()
-    await session.refresh(comment)
-
-    await _set_comment_rate_limit(current_user.id, valkey)
+        comment = Comment(
+            content=body.content,
+            author_id=current_user.id,
+            article_id=article_id,
+        )
+        session.add(comment)
+        await session.commit()
+        await session.refresh(comment)
 
     await rabbitmq_publish(
         exchange_name=settings.consumer.exchange_name,
@@ -130,26 +125,24 @@ async def edit_comment(
     session: AsyncSession = Depends(get_session),
     valkey: aioredis.Redis = Depends(get_valkey_client),
 ) -> Comment:
-    await _check_comment_edit_rate_limit(current_user.id, valkey)
-    await _get_active_article(board_id, article_id, session)
-
-    comment = await session.scalar(
-        select(Comment).where(
-            Comment.id == comment_id,
-            Comment.article_id == article_id,
-            Comment.is_deleted == False,
+    async with _comment_edit_rate_limit(current_user.id, valkey):
+        await _get_active_article(board_id, article_id, session)
+
+        comment = await session.scalar(
+            select(Comment).where(
+                Comment.id == comment_id,
+                Comment.article_id == article_id,
+                Comment.is_deleted == False,
+            )
         )
-    )
-    if comment is None:
-        raise HTTPException(status_code=404, detail="Comment not found")
-    if comment.author_id != current_user.id:
-        raise HTTPException(status_code=403, detail="수정 권한이 없습니다.")
+        if comment is None:
+            raise HTTPException(status_code=404, detail="Comment not found")
+        if comment.author_id != current_user.id:
+            raise HTTPException(status_code=403, detail="수정 권한이 없습니다.")
 
-    comment.content = body.content
-    await session.commit()
-    await session.refresh(comment)
-
-    await _set_comment_edit_rate_limit(current_user.id, valkey)
+        comment.content = body.content
+        await session.commit()
+        await session.refresh(comment)
 
     return comment
 
@@ -163,24 +156,22 @@ async def delete_comment(
     session: AsyncSession = Depends(get_session),
     valkey: aioredis.Redis = Depends(get_valkey_client),
 ) -> str:
-    await _check_comment_edit_rate_limit(current_user.id, valkey)
-    await _get_active_article(board_id, article_id, session)
-
-    comment = await session.scalar(
-        select(Comment).where(
-            Comment.id == comment_id,
-            Comment.article_id == article_id,
-            Comment.is_deleted == False,
+    async with _comment_edit_rate_limit(current_user.id, valkey):
+        await _get_active_article(board_id, article_id, session)
+
+        comment = await session.scalar(
+            select(Comment).where(
+                Comment.id == comment_id,
+                Comment.article_id == article_id,
+                Comment.is_deleted == False,
+            )
         )
-    )
-    if comment is None:
-        raise HTTPException(status_code=404, detail="Comment not found")
-    if comment.author_id != current_user.id:
-        raise HTTPException(status_code=403, detail="삭제 권한이 없습니다.")
-
-    comment.soft_delete()
-    await session.commit()
+        if comment is None:
+            raise HTTPException(status_code=404, detail="Comment not found")
+        if comment.author_id != current_user.id:
+            raise HTTPException(status_code=403, detail="삭제 권한이 없습니다.")
 
-    await _set_comment_edit_rate_limit(current_user.id, valkey)
+        comment.soft_delete()
+        await session.commit()
 
     return "comment is deleted"
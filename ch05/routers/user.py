@@ -66,7 +66,7 @@ async def sign_up(
     session: AsyncSession = Depends(get_session),
 ) -> User:
     user = User(username=body.username, email=body.email, role=UserRole.member)
-    user.set_password(body.password)
+    await user.aset_password(body.password)
     session.add(user)
     try:
         await session.commit()
@@ -104,7 +104,7 @@ async def login(
     user = await session.scalar(
         select(User).where(User.username == body.username, User.is_deleted == False)
     )
-    if user is None or not user.verify_password(body.password):
+    if user is None or not await user.averify_password(body.password):
         raise HTTPException(status_code=401, detail="Invalid username or password")
 
     user.last_login = datetime.now(timezone.utc).replace(tzinfo=None)
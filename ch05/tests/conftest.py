@@ -1,5 +1,5 @@
 import asyncio
-import fcntl
+import os
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -7,8 +7,12 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def test_client():
+    """
+    DB 세션이 필요 없는 테스트용 HTTP 클라이언트 (세션당 1회 생성).
+    lifespan은 mock 처리해 외부 저장소 초기화 없이 사용합니다.
+    """
     with patch("ch05.main.lifespan") as mock_lifespan:
         mock_lifespan.return_value.__aenter__ = AsyncMock(return_value=None)
         mock_lifespan.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -22,15 +26,60 @@ async def test_client():
             yield client
 
 
+@pytest.fixture(scope="session")
+def asgi_call():
+    """
+    httpx 없이 app을 ASGI scope로 직접 호출하는 함수를 반환합니다.
+    header/cookie/body가 필요 없는 단순 GET 등에 사용하며 (status_code, body)를 반환합니다.
+    """
+    from ch05.main import app
+
+    async def call(method: str, path: str) -> tuple[int, bytes]:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"test")],
+            "client": ("127.0.0.1", 123),
+            "server": ("test", 80),
+        }
+        status = 0
+        body = bytearray()
+
+        async def receive() -> dict:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: dict) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                body.extend(message.get("body", b""))
+
+        await app(scope, receive, send)
+        return status, bytes(body)
+
+    return call
+
+
 # ── 세션 단위 픽스처 (챕터당 1회 생성) ─────────────────────────────────────────
 
+# init_db에서 다른 워커의 DB 초기화를 기다리는 최대 시간(초)
+_INIT_DB_TIMEOUT = 120
+
 
 @pytest.fixture(scope="session")
 async def init_db(tmp_path_factory, worker_id):
     """
     MySQL 스키마를 DROP+CREATE 후 마스터 어드민을 생성합니다.
     pytest-xdist 환경에서 여러 워커가 동시에 실행될 때
-    파일 락을 사용해 초기화를 한 번만 수행합니다.
+    symlink sentinel을 사용해 초기화를 한 번만 수행합니다.
     """
     import ch05.models.advertisement  # noqa: F401
     import ch05.models.article  # noqa: F401
@@ -45,57 +94,58 @@ async def init_db(tmp_path_factory, worker_id):
     from ch05.dependencies.valkey import shutdown as valkey_shutdown
     from ch05.main import _create_master_admin
 
-    base = tmp_path_factory.getbasetemp().parent  # 모든 xdist 워커가 공유하는 경로
-    lock_path = str(base / "ch05_init.lock")
+    # 이번 실행에서만 사용하는 경로에 sentinel을 만들어 이전 실행의 파일을 재사용하지 않습니다.
+    # - xdist: basetemp는 pytest-N/popen-gwX이므로 부모(pytest-N)를 워커끼리 공유
+    # - 단일 프로세스: basetemp(pytest-N) 자체를 사용 (부모는 모든 실행이 공유하는 경로)
+    basetemp = tmp_path_factory.getbasetemp()
+    base = basetemp.parent if worker_id.startswith("gw") else basetemp
+    leader_path = base / "ch05_init.leader"
     done_path = base / "ch05_init.done"
 
-    def _try_lock():
-        """
-        배타적 파일 락을 획득합니다.
-        done_path가 없으면 락을 유지한 채 lock file 객체를 반환합니다 (이 워커가 초기화 담당).
-        done_path가 있으면 락을 해제하고 None을 반환합니다 (다른 워커가 이미 초기화 완료).
-        """
-        lf = open(lock_path, "w")
-        fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
-        if done_path.exists():
-            fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
-            lf.close()
-            return None
-        return lf  # 락 유지한 채 반환
-
-    # blocking flock을 별도 스레드에서 실행하여 이벤트 루프 블로킹 방지
-    lock_file = await asyncio.to_thread(_try_lock)
+    # symlink 생성은 원자적이므로 가장 먼저 생성한 워커 하나만 초기화를 담당합니다.
     try:
-        if lock_file is not None:
+        os.symlink("init", leader_path)
+        is_leader = True
+    except FileExistsError:
+        is_leader = False
+
+    if is_leader:
+        status = "failed"
+        try:
             async with _engine.begin() as conn:
                 await conn.run_sync(Base.metadata.drop_all)
                 await conn.run_sync(Base.metadata.create_all)
             await _create_master_admin()
-            done_path.write_text("done")
-    finally:
-        if lock_file is not None:
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
-            lock_file.close()
+            status = "done"
+        finally:
+            # 다른 워커가 쓰다 만 파일을 읽지 않도록 rename으로 원자적으로 생성
+            tmp_path = base / "ch05_init.done.tmp"
+            tmp_path.write_text(status)
+            tmp_path.replace(done_path)
+    else:
+        # 초기화 담당 워커가 끝날 때까지 대기 (담당 워커가 강제 종료되면 무한 대기하지 않도록 제한)
+        deadline = asyncio.get_running_loop().time() + _INIT_DB_TIMEOUT
+        while not done_path.exists():
+            if asyncio.get_running_loop().time() > deadline:
+                raise RuntimeError(
+                    f"{_INIT_DB_TIMEOUT}초 동안 다른 워커의 DB 초기화가 끝나지 않았습니다: "
+                    f"{done_path}"
+                )
+            await asyncio.sleep(0.05)
+        if done_path.read_text() != "done":
+            raise RuntimeError("다른 워커의 DB 초기화가 실패했습니다.")
 
     # 워커별 Valkey DB 분리: flushdb() race condition 방지
     # gw0→DB1, gw1→DB2, ..., master→DB1 (각 워커가 독립된 DB를 사용)
-    import redis.asyncio as aioredis
-
+    # 새 pool을 만들지 않고 기존 pool의 db 설정만 바꿉니다.
+    # (pool은 connection을 생성할 때 SELECT를 실행하므로, 이미 만들어진 connection은 정리)
     import ch05.dependencies.mongodb as mongodb_mod
     import ch05.dependencies.valkey as valkey_mod
     from ch05.config.config import settings
 
     db_num = int(worker_id.lstrip("gw")) + 1 if worker_id.startswith("gw") else 1
-    valkey_mod._client = aioredis.Redis(
-        connection_pool=aioredis.ConnectionPool(
-            host=settings.valkey.host,
-            port=settings.valkey.port,
-            password=settings.valkey.passwd,
-            db=db_num,
-            max_connections=10,
-            decode_responses=True,
-        )
-    )
+    valkey_mod._pool.connection_kwargs["db"] = db_num
+    await valkey_mod._pool.disconnect()
 
     # 워커별 MongoDB database 분리: delete_many({}) race condition 방지
     db_suffix = worker_id if worker_id.startswith("gw") else "master"
@@ -126,13 +176,14 @@ async def admin_headers(init_db) -> dict:
 
 
 @pytest.fixture(scope="session")
-async def member(init_db, worker_id) -> dict:
+async def _bootstrap(init_db, worker_id) -> dict:
     """
-    워커별 고유한 일반 회원을 DB에 직접 생성합니다.
-    JWT 토큰도 직접 생성하여 반환합니다.
+    워커별 일반 회원, 테스트용 게시판/게시글을 한 트랜잭션으로 생성합니다.
+    flush로 PK를 먼저 받아 게시글을 만들고 commit은 한 번만 수행합니다.
     """
-    from ch05.dependencies.auth import create_access_token
     from ch05.dependencies.mysql import _async_session
+    from ch05.models.article import Article
+    from ch05.models.board import Board
     from ch05.models.user import User, UserRole
 
     username = f"testmember_{worker_id}"
@@ -143,14 +194,42 @@ async def member(init_db, worker_id) -> dict:
             role=UserRole.member,
         )
         user.set_password("password123")
-        session.add(user)
+        board = Board(title="테스트 게시판", description="테스트 게시판 설명")
+        session.add_all([user, board])
+        await session.flush()
+
+        # Valkey 기반 rate limit이므로 타임스탬프 백데이트 불필요.
+        article = Article(
+            title="테스트 게시글",
+            content="테스트 내용",
+            author_id=user.id,
+            board_id=board.id,
+        )
+        session.add(article)
+        await session.flush()
+
+        ids = {
+            "member_id": user.id,
+            "username": username,
+            "board_id": board.id,
+            "article_id": article.id,
+        }
         await session.commit()
-        await session.refresh(user)
-        user_id = user.id
+    return ids
 
+
+@pytest.fixture(scope="session")
+async def member(_bootstrap: dict) -> dict:
+    """
+    워커별 고유한 일반 회원 정보를 반환합니다.
+    JWT 토큰도 직접 생성하여 반환합니다.
+    """
+    from ch05.dependencies.auth import create_access_token
+
+    username = _bootstrap["username"]
     token = create_access_token(username)
     return {
-        "id": user_id,
+        "id": _bootstrap["member_id"],
         "username": username,
         "headers": {"Authorization": f"Bearer {token}"},
     }
@@ -162,39 +241,27 @@ async def member_headers(member: dict) -> dict:
 
 
 @pytest.fixture(scope="session")
-async def board_id(init_db) -> int:
-    """테스트용 게시판을 DB에 직접 생성합니다 (세션당 1회)."""
-    from ch05.dependencies.mysql import _async_session
-    from ch05.models.board import Board
+async def board_id(_bootstrap: dict) -> int:
+    """테스트용 게시판 id (세션당 1회 생성)."""
+    return _bootstrap["board_id"]
 
-    async with _async_session() as session:
-        board = Board(title="테스트 게시판", description="테스트 게시판 설명")
-        session.add(board)
-        await session.commit()
-        await session.refresh(board)
-        return board.id
+
+@pytest.fixture(scope="session")
+async def article_id(_bootstrap: dict) -> int:
+    """테스트용 게시글 id (세션당 1회 생성)."""
+    return _bootstrap["article_id"]
 
 
 @pytest.fixture(scope="session")
-async def article_id(board_id: int, member: dict) -> int:
-    """
-    테스트용 게시글을 DB에 직접 생성합니다.
-    Valkey 기반 rate limit이므로 타임스탬프 백데이트 불필요.
-    """
-    from ch05.dependencies.mysql import _async_session
-    from ch05.models.article import Article
+async def _http_client(init_db) -> httpx.AsyncClient:
+    """ASGITransport 기반 HTTP 클라이언트를 세션당 한 번만 생성합니다."""
+    from ch05.main import app
 
-    async with _async_session() as session:
-        article = Article(
-            title="테스트 게시글",
-            content="테스트 내용",
-            author_id=member["id"],
-            board_id=board_id,
-        )
-        session.add(article)
-        await session.commit()
-        await session.refresh(article)
-        return article.id
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        yield client
 
 
 # ── 테스트 단위 픽스처 (savepoint 트랜잭션 격리 + 외부 상태 초기화) ─────────────
@@ -202,15 +269,23 @@ async def article_id(board_id: int, member: dict) -> int:
 
 @pytest.fixture(autouse=True)
 async def _external_cleanup():
-    """각 테스트 종료 후 Valkey와 MongoDB를 초기화합니다."""
+    """각 테스트 종료 후 Valkey, MongoDB와 프로세스 로컬 광고 캐시를 초기화합니다."""
     yield
     from ch05.dependencies.mongodb import _database as mongo_db
     from ch05.dependencies.valkey import _client as valkey_client
-
-    await valkey_client.flushdb()
-    await mongo_db["adViewHistory"].delete_many({})
-    await mongo_db["adClickHistory"].delete_many({})
-    await mongo_db["userNotificationHistory"].delete_many({})
+    from ch05.routers.advertisement import _local_ads, _local_missing
+
+    _local_ads.clear()
+    _local_missing.clear()
+
+    # collection drop은 문서를 하나씩 지우는 delete_many({})와 달리 metadata 작업이며,
+    # 서로 독립적인 정리 작업은 동시에 실행합니다.
+    await asyncio.gather(
+        valkey_client.flushdb(),
+        mongo_db.drop_collection("adViewHistory"),
+        mongo_db.drop_collection("adClickHistory"),
+        mongo_db.drop_collection("userNotificationHistory"),
+    )
 
 
 @pytest.fixture
@@ -245,15 +320,58 @@ async def _test_conn(init_db):
 
 
 @pytest.fixture
-async def api_client(_test_conn) -> httpx.AsyncClient:
-    """savepoint 세션을 사용하는 테스트용 HTTP 클라이언트."""
-    from ch05.main import app
+async def api_client(_http_client: httpx.AsyncClient, _test_conn) -> httpx.AsyncClient:
+    """
+    savepoint 세션을 사용하는 테스트용 HTTP 클라이언트.
+    클라이언트는 세션 동안 재사용하고, 세션 격리는 _test_conn의 override가 담당합니다.
+    """
+    return _http_client
 
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        yield client
+
+@pytest.fixture
+async def seed_ad_history() -> None:
+    """
+    광고 히스토리 집계 테스트용 어제 날짜 데이터를 삽입합니다.
+    _external_cleanup이 테스트마다 collection을 drop하므로 테스트 단위로 생성하며,
+    두 collection은 insert_many(ordered=False)로 동시에 저장합니다.
+    - adViewHistory(ad_id=999): 로그인 유저 2명 + 익명 1명 → unique 3
+    - adClickHistory(ad_id=888): 같은 user1이 2번 클릭 + 익명 1명 → unique 2
+    """
+    from datetime import datetime, time, timedelta, timezone
+
+    from ch05.dependencies.mongodb import _database as mongo_db
+
+    yesterday_start = datetime.combine(
+        datetime.now(timezone.utc).date(), time.min
+    ) - timedelta(days=1)
+
+    view_docs = [
+        {
+            "ad_id": 999,
+            "username": "user1",
+            "client_ip": "1.2.3.4",
+            "is_true_view": True,
+        },
+        {
+            "ad_id": 999,
+            "username": "user2",
+            "client_ip": "1.2.3.5",
+            "is_true_view": True,
+        },
+        {"ad_id": 999, "username": None, "client_ip": "1.2.3.6", "is_true_view": False},
+    ]
+    click_docs = [
+        {"ad_id": 888, "username": "user1", "client_ip": "1.2.3.4"},
+        {"ad_id": 888, "username": "user1", "client_ip": "1.2.3.4"},
+        {"ad_id": 888, "username": None, "client_ip": "9.8.7.6"},
+    ]
+    for doc in (*view_docs, *click_docs):
+        doc["created_date"] = yesterday_start
+
+    await asyncio.gather(
+        mongo_db["adViewHistory"].insert_many(view_docs, ordered=False),
+        mongo_db["adClickHistory"].insert_many(click_docs, ordered=False),
+    )
 
 
 @pytest.fixture
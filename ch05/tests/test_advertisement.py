@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta, timezone
+import asyncio
 
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -88,8 +88,12 @@ class TestGetAd:
         )
         ad_id = create_resp.json()["id"]
 
-        response1 = await api_client.get(f"/ads/{ad_id}")
-        response2 = await api_client.get(f"/ads/{ad_id}")
+        # write_ad에서 캐싱되어 두 요청 모두 DB 세션을 사용하지 않으므로 동시에 요청합니다.
+        # (api_client의 요청들은 하나의 savepoint 세션을 공유하므로 DB 조회가 있으면 불가)
+        response1, response2 = await asyncio.gather(
+            api_client.get(f"/ads/{ad_id}"),
+            api_client.get(f"/ads/{ad_id}"),
+        )
 
         assert response1.status_code == 200
         assert response2.status_code == 200
@@ -105,25 +109,58 @@ class TestGetAd:
         """Valkey 캐시가 없을 때 DB에서 조회 후 Valkey에 저장됩니다."""
         from ch05.dependencies.valkey import _client as valkey_client
         from ch05.models.advertisement import Advertisement
+        from ch05.routers.advertisement import (
+            _AD_CACHE_KEY,
+            _local_ads,
+            _local_missing,
+        )
 
         # DB에 직접 삽입 (Valkey 캐시 없음)
         ad = Advertisement(title="DB 전용 광고", content="내용")
         db_session.add(ad)
         await db_session.flush()
-        await db_session.refresh(ad)
         ad_id = ad.id
+        # api_client와 세션을 공유하므로 identity map에서 분리해 라우트가 DB에서 조회하게 합니다.
+        # (refresh로 server_default 컬럼을 다시 읽는 SELECT가 필요 없음)
+        db_session.expunge(ad)
 
         # 캐시 없음 확인
-        cached = await valkey_client.get(f"ad:{ad_id}")
-        assert cached is None
+        cached = await valkey_client.hgetall(_AD_CACHE_KEY.format(ad_id=ad_id))
+        assert cached == {}
 
         # 조회 → DB에서 가져오고 Valkey에 저장
         response = await api_client.get(f"/ads/{ad_id}")
         assert response.status_code == 200
 
-        # 이후 Valkey에 캐싱됨
-        cached = await valkey_client.get(f"ad:{ad_id}")
-        assert cached is not None
+        # 이후 Valkey Hash에 캐싱됨
+        cached = await valkey_client.hgetall(_AD_CACHE_KEY.format(ad_id=ad_id))
+        assert cached["title"] == "DB 전용 광고"
+
+        # 프로세스 로컬 캐시를 비워 두 번째 조회가 Valkey Hash(_ad_from_hash)를 거치게 합니다.
+        _local_ads.clear()
+        _local_missing.clear()
+
+        # 캐시에서 읽은 응답이 DB에서 읽은 응답과 동일
+        cached_response = await api_client.get(f"/ads/{ad_id}")
+        assert cached_response.json() == response.json()
+
+    async def test_legacy_string_cache_key_ignored(
+        self, api_client: httpx.AsyncClient, admin_headers: dict
+    ):
+        """이전 버전이 JSON 문자열로 저장한 캐시 key가 남아 있어도 정상 조회됩니다."""
+        from ch05.dependencies.valkey import _client as valkey_client
+
+        create_resp = await api_client.post(
+            "/ads",
+            json={"title": "레거시 캐시 광고", "content": "내용"},
+            headers=admin_headers,
+        )
+        ad_id = create_resp.json()["id"]
+        await valkey_client.set(f"ad:{ad_id}", '{"title": "old"}')
+
+        response = await api_client.get(f"/ads/{ad_id}")
+        assert response.status_code == 200
+        assert response.json()["title"] == "레거시 캐시 광고"
 
     async def test_not_found(self, api_client: httpx.AsyncClient):
         response = await api_client.get("/ads/99999")
@@ -144,8 +181,11 @@ class TestGetAd:
 
         await api_client.get(f"/ads/{ad_id}")
 
-        count = await mongo_db["adViewHistory"].count_documents({"ad_id": ad_id})
-        assert count == 1
+        # collection은 테스트마다 drop되므로 최대 2건만 조회해 정확히 1건인지 확인합니다.
+        docs = (
+            await mongo_db["adViewHistory"].find({}, {"_id": 0, "ad_id": 1}).to_list(2)
+        )
+        assert docs == [{"ad_id": ad_id}]
 
     async def test_view_history_with_authenticated_user(
         self,
@@ -207,8 +247,11 @@ class TestClickAd:
         assert response.status_code == 200
         assert response.json() == "click"
 
-        count = await mongo_db["adClickHistory"].count_documents({"ad_id": ad_id})
-        assert count == 1
+        # collection은 테스트마다 drop되므로 최대 2건만 조회해 정확히 1건인지 확인합니다.
+        docs = (
+            await mongo_db["adClickHistory"].find({}, {"_id": 0, "ad_id": 1}).to_list(2)
+        )
+        assert docs == [{"ad_id": ad_id}]
 
     async def test_click_not_found(self, api_client: httpx.AsyncClient):
         response = await api_client.post("/ads/99999/click")
@@ -246,42 +289,10 @@ class TestAdViewHistory:
         assert response.json() == []
 
     async def test_history_aggregation(
-        self, api_client: httpx.AsyncClient, admin_headers: dict
+        self, api_client: httpx.AsyncClient, seed_ad_history: None
     ):
         """MongoDB에 어제 날짜 데이터를 직접 삽입하면 집계 결과에 포함됩니다."""
-        from ch05.dependencies.mongodb import _database as mongo_db
-
-        yesterday_start = datetime.now(timezone.utc).replace(
-            hour=0, minute=0, second=0, microsecond=0, tzinfo=None
-        ) - timedelta(days=1)
-
-        # 어제 날짜로 직접 삽입 (로그인 유저 2명, 익명 1명)
-        await mongo_db["adViewHistory"].insert_many(
-            [
-                {
-                    "ad_id": 999,
-                    "username": "user1",
-                    "client_ip": "1.2.3.4",
-                    "is_true_view": True,
-                    "created_date": yesterday_start,
-                },
-                {
-                    "ad_id": 999,
-                    "username": "user2",
-                    "client_ip": "1.2.3.5",
-                    "is_true_view": True,
-                    "created_date": yesterday_start,
-                },
-                {
-                    "ad_id": 999,
-                    "username": None,
-                    "client_ip": "1.2.3.6",
-                    "is_true_view": False,
-                    "created_date": yesterday_start,
-                },
-            ]
-        )
-
+        # 어제 날짜 데이터 (로그인 유저 2명, 익명 1명) — seed_ad_history 참고
         response = await api_client.get("/ads/history/view")
         assert response.status_code == 200
         results = response.json()
@@ -298,39 +309,10 @@ class TestAdClickHistory:
         assert response.json() == []
 
     async def test_history_aggregation(
-        self, api_client: httpx.AsyncClient, admin_headers: dict
+        self, api_client: httpx.AsyncClient, seed_ad_history: None
     ):
         """MongoDB에 어제 날짜 클릭 데이터를 직접 삽입하면 집계 결과에 포함됩니다."""
-        from ch05.dependencies.mongodb import _database as mongo_db
-
-        yesterday_start = datetime.now(timezone.utc).replace(
-            hour=0, minute=0, second=0, microsecond=0, tzinfo=None
-        ) - timedelta(days=1)
-
-        # 중복 포함 (같은 user1이 2번 클릭 → unique 1명으로 집계)
-        await mongo_db["adClickHistory"].insert_many(
-            [
-                {
-                    "ad_id": 888,
-                    "username": "user1",
-                    "client_ip": "1.2.3.4",
-                    "created_date": yesterday_start,
-                },
-                {
-                    "ad_id": 888,
-                    "username": "user1",
-                    "client_ip": "1.2.3.4",
-                    "created_date": yesterday_start,
-                },
-                {
-                    "ad_id": 888,
-                    "username": None,
-                    "client_ip": "9.8.7.6",
-                    "created_date": yesterday_start,
-                },
-            ]
-        )
-
+        # 중복 포함 (같은 user1이 2번 클릭 → unique 1명으로 집계) — seed_ad_history 참고
         response = await api_client.get("/ads/history/click")
         assert response.status_code == 200
         results = response.json()
@@ -247,7 +247,6 @@ class TestSearchArticles:
         )
         db_session.add(article)
         await db_session.flush()
-        await db_session.refresh(article)
         article_id = article.id
 
         await os_client.index(
@@ -342,6 +341,24 @@ class TestEditArticle:
         assert response.status_code == 200
         assert response.json()["title"] == "테스트 게시글"
 
+    async def test_no_changes_does_not_consume_rate_limit(
+        self,
+        api_client: httpx.AsyncClient,
+        board_id: int,
+        article_id: int,
+        member_headers: dict,
+    ):
+        """변경 사항이 없는 수정 요청은 rate limit에 포함되지 않습니다."""
+        url = f"/boards/{board_id}/articles/{article_id}"
+        response = await api_client.put(url, json={}, headers=member_headers)
+        assert response.status_code == 200
+
+        response = await api_client.put(
+            url, json={"title": "빈 수정 후 제목"}, headers=member_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["title"] == "빈 수정 후 제목"
+
     async def test_no_permission(
         self,
         api_client: httpx.AsyncClient,
@@ -0,0 +1,54 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+
+
+def _message(body: bytes) -> MagicMock:
+    message = MagicMock()
+    message.body = body
+    message.routing_key = "wikibook.test"
+    message.ack = AsyncMock()
+    message.nack = AsyncMock()
+    message.reject = AsyncMock()
+    return message
+
+
+class TestOnMessage:
+    async def test_success_acks(self):
+        from ch05.consumer import on_message
+
+        http_client = AsyncMock()
+        http_client.post.return_value = httpx.Response(200)
+        message = _message(b'{"type": "unknown_type"}')
+
+        await on_message(message, http_client=http_client)
+
+        message.ack.assert_awaited_once()
+        message.nack.assert_not_awaited()
+        message.reject.assert_not_awaited()
+
+    async def test_http_error_requeues(self):
+        from ch05.consumer import on_message
+
+        http_client = AsyncMock()
+        http_client.post.side_effect = httpx.ConnectError("connection refused")
+        message = _message(b"{}")
+
+        await on_message(message, http_client=http_client)
+
+        message.nack.assert_awaited_once_with(requeue=True)
+        message.ack.assert_not_awaited()
+
+    async def test_non_utf8_body_rejects(self):
+        """UTF-8이 아닌 body는 재처리하지 않고 reject합니다."""
+        from ch05.consumer import on_message
+
+        http_client = AsyncMock()
+        message = _message(b"\xff\xfe\xfd")
+
+        await on_message(message, http_client=http_client)
+
+        message.reject.assert_awaited_once_with(requeue=False)
+        message.ack.assert_not_awaited()
+        message.nack.assert_not_awaited()
+        http_client.post.assert_not_awaited()
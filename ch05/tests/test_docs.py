@@ -0,0 +1,23 @@
+import httpx
+import pytest
+
+
+class TestDocs:
+    @pytest.mark.parametrize("path", ["/docs", "/redoc"])
+    async def test_openapi_url(self, test_client: httpx.AsyncClient, path: str):
+        response = await test_client.get(path)
+        assert response.status_code == 200
+        assert "/openapi.json" in response.text
+
+    @pytest.mark.parametrize("path", ["/docs", "/redoc"])
+    async def test_openapi_url_with_root_path(self, path: str):
+        """proxy 등으로 root_path가 설정되면 openapi.json 경로 앞에 붙입니다."""
+        from ch05.main import app
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app, root_path="/api"),
+            base_url="http://test",
+        ) as client:
+            response = await client.get(path)
+        assert response.status_code == 200
+        assert "/api/openapi.json" in response.text
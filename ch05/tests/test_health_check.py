@@ -1,8 +1,76 @@
-import httpx
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.responses import ORJSONResponse
+
+# 요청 처리 중 event loop가 다른 task를 실행하지 못한 최대 시간(초)의 허용치.
+# 정상적인 /health 100건은 수십 ms 안에 끝나므로 부하가 있는 CI에서도 넘지 않도록 넉넉하게 잡고,
+# 요청마다 동기 호출(예: bcrypt 해시)이 끼어들면 이 값을 크게 넘습니다.
+_LOOP_LAG_LIMIT = 0.5
+
+
+async def _run_with_loop_lag(coro):
+    """
+    coro를 실행하면서 heartbeat task로 event loop가 멈춘 최대 시간을 측정합니다.
+    (coro의 결과, 최대 지연 시간(초))를 반환합니다.
+    """
+    loop = asyncio.get_running_loop()
+    max_lag = 0.0
+    done = False
+
+    async def heartbeat():
+        nonlocal max_lag
+        last = loop.time()
+        while not done:
+            await asyncio.sleep(0.001)
+            now = loop.time()
+            max_lag = max(max_lag, now - last)
+            last = now
+
+    task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)  # heartbeat가 먼저 시작되도록 양보
+    try:
+        result = await coro
+    finally:
+        done = True
+        await task
+    return result, max_lag
+
+
+async def _gather_health(asgi_call, concurrency: int):
+    return await asyncio.gather(
+        *(asgi_call("GET", "/health") for _ in range(concurrency))
+    )
 
 
 class TestHealthCheck:
-    async def test_health_check(self, test_client: httpx.AsyncClient):
-        response = await test_client.get("/health")
-        assert response.status_code == 200
-        assert response.json() == "ok"
+    async def test_health_check(self, asgi_call):
+        status, body = await asgi_call("GET", "/health")
+        assert status == 200
+        assert json.loads(body) == "ok"
+
+    @pytest.mark.parametrize("concurrency", [10, 100])
+    async def test_concurrent_health_check(self, asgi_call, concurrency: int):
+        """동시에 들어온 요청을 모두 처리하고, 처리 중 event loop를 막지 않습니다."""
+        results, lag = await _run_with_loop_lag(_gather_health(asgi_call, concurrency))
+
+        assert all(status == 200 for status, _ in results)
+        assert all(json.loads(body) == "ok" for _, body in results)
+        assert lag < _LOOP_LAG_LIMIT
+
+    async def test_blocking_call_is_detected(self, asgi_call):
+        """응답 경로에 동기 호출이 끼어들면 위 테스트의 지연 시간 검사에 걸립니다."""
+        render = ORJSONResponse.render
+
+        def blocking_render(self, content):
+            time.sleep(0.01)  # 요청마다 event loop를 10ms씩 막는 동기 호출
+            return render(self, content)
+
+        with patch.object(ORJSONResponse, "render", blocking_render):
+            results, lag = await _run_with_loop_lag(_gather_health(asgi_call, 100))
+
+        assert all(status == 200 for status, _ in results)
+        assert lag >= _LOOP_LAG_LIMIT
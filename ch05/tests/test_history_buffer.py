@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+import pytest
+
+import ch05.dependencies.history_buffer as history_buffer
+
+_COLLECTION = "adViewHistory"  # _external_cleanup이 테스트마다 drop하는 collection
+
+
+@pytest.fixture
+async def running_buffer(init_db):
+    """flusher를 시작하고, 테스트가 실패해도 종료 상태로 되돌립니다."""
+    await history_buffer.startup()
+    try:
+        yield history_buffer
+    finally:
+        await history_buffer.shutdown()
+
+
+class TestHistoryBuffer:
+    async def test_enqueue_without_startup(self):
+        """flusher가 실행 중이 아니면 False를 반환해 호출하는 쪽이 직접 저장하게 합니다."""
+        assert history_buffer.enqueue(_COLLECTION, {"ad_id": 1}) is False
+
+    async def test_batches_and_drains_on_shutdown(self, running_buffer):
+        """_BATCH_SIZE보다 많은 문서도 insert_many로 나누어 모두 저장하고, 종료 시 비웁니다."""
+        from ch05.dependencies.mongodb import get_database
+
+        count = history_buffer._BATCH_SIZE * 2 + 10
+        with patch.object(
+            history_buffer, "_write", wraps=history_buffer._write
+        ) as write:
+            for i in range(count):
+                assert history_buffer.enqueue(_COLLECTION, {"ad_id": i})
+            await history_buffer.shutdown()
+
+        batch_sizes = [len(call.args[1]) for call in write.call_args_list]
+        assert sum(batch_sizes) == count
+        assert len(batch_sizes) >= 3
+        assert max(batch_sizes) <= history_buffer._BATCH_SIZE
+
+        db = await get_database()
+        assert await db[_COLLECTION].count_documents({}) == count
+        assert history_buffer._tasks == []
+        assert history_buffer._queues == {}
+        assert history_buffer.enqueue(_COLLECTION, {"ad_id": 0}) is False
+
+    async def test_queue_full(self, running_buffer, monkeypatch):
+        """대기열이 가득 차면 False를 반환하고, 이미 들어간 문서는 종료 시 저장합니다."""
+        from ch05.dependencies.mongodb import get_database
+
+        monkeypatch.setattr(history_buffer, "_QUEUE_SIZE", 2)
+
+        assert history_buffer.enqueue(_COLLECTION, {"ad_id": 1}) is True
+        assert history_buffer.enqueue(_COLLECTION, {"ad_id": 2}) is True
+        assert history_buffer.enqueue(_COLLECTION, {"ad_id": 3}) is False
+
+        await history_buffer.shutdown()
+        db = await get_database()
+        assert await db[_COLLECTION].count_documents({}) == 2
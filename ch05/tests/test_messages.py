@@ -61,10 +61,13 @@ class TestProcessMessage:
         assert response.json() == "ok"
 
         # MongoDB에 알림 1건 저장 확인
-        count = await mongo_db["userNotificationHistory"].count_documents(
-            {"userId": member["id"]}
+        # 최대 2건만 조회해 정확히 1건인지 확인합니다.
+        docs = (
+            await mongo_db["userNotificationHistory"]
+            .find({}, {"_id": 0, "userId": 1})
+            .to_list(2)
         )
-        assert count == 1
+        assert docs == [{"userId": member["id"]}]
 
     async def test_write_article_nonexistent(self, api_client: httpx.AsyncClient):
         """존재하지 않는 게시글에 대한 알림 메시지는 MongoDB에 저장하지 않고 ok를 반환합니다."""
@@ -82,7 +85,7 @@ class TestProcessMessage:
         assert response.status_code == 200
         assert response.json() == "ok"
 
-        count = await mongo_db["userNotificationHistory"].count_documents({})
+        count = await mongo_db["userNotificationHistory"].estimated_document_count()
         assert count == 0
 
     async def test_write_comment_saves_notification(
@@ -116,10 +119,13 @@ class TestProcessMessage:
         assert response.json() == "ok"
 
         # 댓글 작성자 = 게시글 작성자 = member → unique 1명 → 알림 1건
-        count = await mongo_db["userNotificationHistory"].count_documents(
-            {"userId": member["id"]}
+        # 최대 2건만 조회해 정확히 1건인지 확인합니다.
+        docs = (
+            await mongo_db["userNotificationHistory"]
+            .find({}, {"_id": 0, "userId": 1})
+            .to_list(2)
         )
-        assert count == 1
+        assert docs == [{"userId": member["id"]}]
 
     async def test_write_comment_nonexistent(self, api_client: httpx.AsyncClient):
         """존재하지 않는 댓글에 대한 메시지는 MongoDB에 저장하지 않고 ok를 반환합니다."""
@@ -135,5 +141,58 @@ class TestProcessMessage:
         assert response.status_code == 200
         assert response.json() == "ok"
 
-        count = await mongo_db["userNotificationHistory"].count_documents({})
+        count = await mongo_db["userNotificationHistory"].estimated_document_count()
         assert count == 0
+
+
+class TestProcessRawMessage:
+    async def test_write_article_saves_notification(
+        self,
+        api_client: httpx.AsyncClient,
+        board_id: int,
+        member_headers: dict,
+        member: dict,
+    ):
+        """raw body로 전달된 write_article 메시지도 알림을 저장합니다."""
+        from ch05.dependencies.mongodb import _database as mongo_db
+
+        write_resp = await api_client.post(
+            f"/boards/{board_id}/articles",
+            json={"title": "raw 알림 테스트 게시글", "content": "내용"},
+            headers=member_headers,
+        )
+        assert write_resp.status_code == 201
+        article_id = write_resp.json()["id"]
+
+        response = await api_client.post(
+            "/internal/messages/raw",
+            content=json.dumps(
+                {
+                    "type": "write_article",
+                    "article_id": article_id,
+                    "user_id": member["id"],
+                }
+            ).encode(),
+            headers={
+                "Content-Type": "application/octet-stream",
+                "X-Routing-Key": "article.created",
+            },
+        )
+        assert response.status_code == 200
+        assert response.json() == "ok"
+
+        # 최대 2건만 조회해 정확히 1건인지 확인합니다.
+        docs = (
+            await mongo_db["userNotificationHistory"]
+            .find({}, {"_id": 0, "userId": 1})
+            .to_list(2)
+        )
+        assert docs == [{"userId": member["id"]}]
+
+    async def test_missing_routing_key(self, test_client: httpx.AsyncClient):
+        """X-Routing-Key 헤더가 없으면 422를 반환합니다."""
+        response = await test_client.post(
+            "/internal/messages/raw",
+            content=b'{"type": "unknown_type"}',
+        )
+        assert response.status_code == 422
@@ -0,0 +1,27 @@
+class TestMongoIndexes:
+    async def test_history_indexes(self, init_db):
+        """광고 히스토리 collection에 집계용 복합 인덱스와 90일 TTL 인덱스를 생성합니다."""
+        from ch05.dependencies.mongodb import get_database
+        from ch05.main import _HISTORY_TTL_SECONDS, _init_mongo_indexes
+
+        await _init_mongo_indexes()
+
+        db = await get_database()
+        for collection in ("adViewHistory", "adClickHistory"):
+            indexes = await db[collection].index_information()
+            keys = {tuple(info["key"]): info for info in indexes.values()}
+
+            assert (
+                ("created_date", 1),
+                ("ad_id", 1),
+                ("username", 1),
+                ("client_ip", 1),
+            ) in keys
+            assert (("ad_id", 1), ("created_date", -1)) in keys
+            ttl = keys[(("created_date", 1),)]
+            assert ttl["expireAfterSeconds"] == _HISTORY_TTL_SECONDS == 90 * 24 * 3600
+
+        notification = await db["userNotificationHistory"].index_information()
+        assert [("userId", 1), ("createdDate", -1)] in [
+            info["key"] for info in notification.values()
+        ]
@@ -0,0 +1,10 @@
+class TestWarmupPool:
+    async def test_warmup_pool(self, init_db):
+        """pool_size만큼 연결을 미리 생성한 뒤 모두 pool에 반환합니다."""
+        from ch05.config.config import settings
+        from ch05.dependencies.mysql import _engine, _warmup_pool
+
+        await _warmup_pool()
+
+        assert _engine.pool.checkedout() == 0
+        assert _engine.pool.checkedin() >= settings.mysql.pool_size
@@ -1,4 +1,7 @@
+import asyncio
+
 import httpx
+import pytest
 
 
 class TestSignUp:
@@ -261,3 +264,77 @@ class TestUpdateRole:
             headers=admin_headers,
         )
         assert response.status_code == 404
+
+
+class TestHashMany:
+    def test_hash_and_verify_many(self):
+        """여러 비밀번호를 병렬로 해시/검증하며 입력 순서를 유지합니다."""
+        from ch05.models.user import hash_many, verify_many
+
+        hashes = hash_many(["password1", "password2"])
+        assert len(hashes) == 2
+        assert hashes[0] != hashes[1]
+
+        results = verify_many(
+            [
+                ("password1", hashes[0]),
+                ("password2", hashes[1]),
+                ("wrong", hashes[0]),
+                ("password1", None),
+            ]
+        )
+        assert results == [True, True, False, False]
+
+    def test_empty(self):
+        from ch05.models.user import hash_many, verify_many
+
+        assert hash_many([]) == []
+        assert verify_many([]) == []
+
+
+class TestCalibrateBcrypt:
+    def test_never_below_min_rounds(self):
+        """target_ms가 아무리 작아도 min_rounds보다 낮은 cost를 반환하지 않습니다."""
+        from ch05.models.user import calibrate_bcrypt_rounds
+
+        assert calibrate_bcrypt_rounds(target_ms=0, min_rounds=5) == 5
+        assert calibrate_bcrypt_rounds(target_ms=1, min_rounds=6) >= 6
+
+    def test_default_floor_is_configured_rounds(self):
+        from ch05.config.config import settings
+        from ch05.models.user import calibrate_bcrypt_rounds
+
+        assert calibrate_bcrypt_rounds(target_ms=0) == settings.bcrypt.rounds
+
+    def test_rounds_out_of_range(self):
+        from pydantic import ValidationError
+
+        from ch05.config.config import BcryptConfig
+
+        with pytest.raises(ValidationError):
+            BcryptConfig(rounds=3)
+        with pytest.raises(ValidationError):
+            BcryptConfig(rounds=32)
+
+
+class TestAsyncPassword:
+    async def test_averify_password_does_not_block_event_loop(self):
+        """
+        bcrypt 검증이 thread에서 실행되어, 검증이 끝나기 전에 다른 coroutine이 실행됩니다.
+        (동기 호출로 바뀌면 검증이 먼저 끝나 순서가 뒤바뀝니다.)
+        """
+        from ch05.models.user import User
+
+        user = User(username="nonblocking")
+        await user.aset_password("password123")
+        order = []
+
+        async def verify():
+            assert await user.averify_password("password123")
+            order.append("verify")
+
+        async def other():
+            order.append("other")
+
+        await asyncio.gather(verify(), other())
+        assert order == ["other", "verify"]
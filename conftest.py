@@ -3,6 +3,9 @@ import sys
 
 import pytest
 
+# 테스트 경로 인자에서 챕터 디렉토리(ch01, ch05/tests/ 등)를 추출
+_CHAPTER_RE = re.compile(r"(ch\d+)[/\\]?")
+
 
 @pytest.hookimpl(tryfirst=True)
 def pytest_cmdline_main(config: pytest.Config) -> int | None:
@@ -30,12 +33,9 @@ def pytest_cmdline_main(config: pytest.Config) -> int | None:
 
     config._chapter_check_done = True  # type: ignore[attr-defined]
 
-    args = config.args or []
-    chapters: set[str] = set()
-    for arg in args:
-        m = re.match(r"(ch\d+)[/\\]?", str(arg))
-        if m:
-            chapters.add(m.group(1))
+    chapters = {
+        m.group(1) for arg in config.args or [] if (m := _CHAPTER_RE.match(str(arg)))
+    }
 
     if len(chapters) > 1:
         chapter_list = ", ".join(sorted(chapters))